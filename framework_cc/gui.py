@@ -8,17 +8,30 @@ from typing import Optional
 import customtkinter as ctk
 from PIL import Image
 import threading
+from concurrent.futures import ThreadPoolExecutor
+import queue
+import re
+import hashlib
 import subprocess
 import sys
 import os
 import logging
 from tkinter import font
-from datetime import datetime
+from datetime import date
 import shutil
 import winreg
 import ctypes
 import tkinter.messagebox as messagebox
 import time
+from dataclasses import dataclass
+from collections import defaultdict, deque
+from functools import lru_cache
+from itertools import takewhile
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup, fall back to stdlib json
+    orjson = None
 
 from .models import SystemConfig, HardwareMetrics
 from .hardware import HardwareMonitor
@@ -30,18 +43,241 @@ from .power_plan import PowerManager, PowerProfile
 
 logger = logging.getLogger(__name__)
 
+def _bind_win32(dll_name: str, func_name: str, argtypes: list, restype):
+    """Resolve a Win32 function once and declare its signature.
+    
+    Returns None if the DLL or function is not available on this system.
+    """
+    try:
+        func = getattr(getattr(ctypes.windll, dll_name), func_name)
+    except (AttributeError, OSError):
+        return None
+    func.argtypes = argtypes
+    func.restype = restype
+    return func
+
+# Win32 functions resolved at import instead of on every call
+if sys.platform.startswith('win'):
+    from ctypes import wintypes
+    _ShowWindow = _bind_win32("user32", "ShowWindow", [wintypes.HWND, ctypes.c_int], wintypes.BOOL)
+    _GetConsoleWindow = _bind_win32("kernel32", "GetConsoleWindow", [], wintypes.HWND)
+    _SetProcessDPIAware = _bind_win32("user32", "SetProcessDPIAware", [], wintypes.BOOL)
+    _GetDpiForSystem = _bind_win32("user32", "GetDpiForSystem", [], wintypes.UINT)
+    _GetProcessDpiAwareness = _bind_win32(
+        "shcore", "GetProcessDpiAwareness", [wintypes.HANDLE, ctypes.POINTER(ctypes.c_int)], ctypes.c_long
+    )
+    _IsUserAnAdmin = _bind_win32("shell32", "IsUserAnAdmin", [], wintypes.BOOL)
+else:
+    _ShowWindow = _GetConsoleWindow = _SetProcessDPIAware = None
+    _GetDpiForSystem = _GetProcessDpiAwareness = _IsUserAnAdmin = None
+
+# PyInstaller creates a temp folder and stores path in _MEIPASS, otherwise
+# resources live in the project root (the directory main.py runs from)
+_MEIPASS_PATH = getattr(sys, "_MEIPASS", None)
+_BASE_PATH = Path(_MEIPASS_PATH) if _MEIPASS_PATH else Path(__file__).resolve().parent.parent
+
+@lru_cache(maxsize=None)
 def get_resource_path(relative_path):
     """Get absolute path to resource for PyInstaller bundled app."""
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(".")
+    return os.path.join(_BASE_PATH, relative_path)
+
+# Application logo, used for the tray icon and every window icon
+_LOGO_ICO = str(_BASE_PATH / "assets" / "logo.ico")
+_LOGO_EXISTS = os.path.exists(_LOGO_ICO)
+
+def _dump_json(data) -> bytes:
+    """Serialize data to indented JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+def _load_json(data: bytes):
+    """Parse JSON from raw bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Theme files start with their "name" entry, read it without parsing the whole file.
+# Only a "name" opening the top-level object matches, nested "name" keys are not mistaken for it
+_THEME_NAME_RE = re.compile(rb'\s*\{\s*"name"\s*:\s*"([^"\\]+)"')
+
+def _read_theme_name(path: str) -> str:
+    """Return the display name stored in a theme file."""
+    # Theme files are a couple of KiB, a single read beats setting up an mmap
+    with open(path, "rb") as f:
+        head = f.read(2048)
+        match = _THEME_NAME_RE.match(head)
+        if match:
+            return match.group(1).decode("utf-8")
+        # Other key order or escaped characters, fall back to a full parse
+        return _load_json(head + f.read())["name"]
+
+# Header rows of the winget list/upgrade tables (English, French, Chinese)
+_WINGET_LIST_HEADER_RE = re.compile(r"(Name|Nom|名称)\s+(Id|ID|标识符)\s+(Version|版本)")
+_WINGET_UPGRADE_HEADER_RE = re.compile(r"(Name|Nom|名称)\s.*(Version|版本)\s+(Available|Disponible|可用)")
+
+@lru_cache(maxsize=None)
+def _winget_upgrade_row_re(trailing: int) -> re.Pattern:
+    """Regex of the winget upgrade rows: name, id, version, available, then trailing one-word columns.
     
-    return os.path.join(base_path, relative_path)
+    Only the name may contain spaces, the other columns are anchored from the end of the line.
+    """
+    return re.compile(
+        r"^(.+?)[ \t]+\S+[ \t]+((?:<[ \t]+)?\S+)[ \t]+(\S+)" + r"[ \t]+\S+" * trailing + r"[ \t]*$",
+        re.M
+    )
+
+def _progress_role(label: str) -> str:
+    """Theme color role of a metric progress bar, from its label."""
+    text = label.lower()
+    if "cpu" in text:
+        return "progress_cpu"
+    if "gpu" in text:
+        return "progress_gpu"
+    if "ram" in text:
+        return "progress_ram"
+    if "temp" in text:
+        return "progress_temp"
+    return "progress_bar"
+
+@dataclass(slots=True)
+class MetricCfg:
+    """Progress bar scaling and label format for one metric."""
+    factor: float
+    bias: float
+    clamp: bool
+    fmt: str
+
+@dataclass(slots=True)
+class PackageRow:
+    """One package of the updates list."""
+    name: str
+    current: str
+    new: Optional[str]
+
+# Height of a package row in the updates list, its pady included
+_PACKAGE_ROW_HEIGHT = 36
+# Package rows created per idle pass when the row pool grows
+_ROW_POOL_BATCH = 5
+
+# Decoded icons shared by every window, keyed by (asset name, size)
+_ICON_CACHE: dict[tuple[str, tuple[int, int]], ctk.CTkImage] = {}
+
+def _get_icon(name: str, size: tuple[int, int]) -> ctk.CTkImage:
+    """Get a CTkImage for an asset PNG, decoding it only on first use."""
+    icon = _ICON_CACHE.get((name, size))
+    if icon is None:
+        icon = ctk.CTkImage(Image.open(get_resource_path(f"assets/{name}.png")), size=size)
+        _ICON_CACHE[(name, size)] = icon
+    return icon
+
+# Power profile -> icon asset name
+_PROFILE_ICONS = {"Silent": "eco", "Balanced": "balanced", "Boost": "performance"}
+
+# Translation keys of the power profile buttons
+_PROFILE_TRANSLATION_KEY = {profile: f"power_profiles.{profile.lower()}" for profile in _PROFILE_ICONS}
+
+@lru_cache(maxsize=None)
+def _refresh_translation_key(mode: str) -> str:
+    """Translation key of a refresh rate button, "Auto" or a rate reported by the display."""
+    mode_key = mode.lower()
+    if mode_key != "auto":
+        mode_key = f"{mode_key}hz"  # Add 'hz' suffix for numeric rates
+    return f"refresh_rates.{mode_key}"
+
+# Configuration options supported by each widget class, filled lazily by _widget_keys
+_CLASS_KEYS_CACHE: dict[type, frozenset[str]] = {}
+
+def _widget_keys(widget) -> frozenset[str]:
+    """Return the configuration options of a widget, computed once per widget class."""
+    widget_type = type(widget)
+    keys = _CLASS_KEYS_CACHE.get(widget_type)
+    if keys is None:
+        keys = frozenset(widget.keys()) if hasattr(widget, 'configure') else frozenset()
+        _CLASS_KEYS_CACHE[widget_type] = keys
+    return keys
+
+def _button_colors(widget, colors, kwargs: dict) -> None:
+    """Add the theme colors of a button to the pending configure options."""
+    if widget.cget('text') == "×":  # Close button
+        kwargs["fg_color"] = colors.button.danger
+        kwargs["hover_color"] = colors.status.error
+    else:
+        kwargs["fg_color"] = colors.button.primary
+        kwargs["hover_color"] = colors.hover
+    kwargs["text_color"] = colors.text.primary
+
+def _progressbar_colors(widget, colors, kwargs: dict) -> None:
+    """Add the theme colors of an unregistered progress bar, guessed from its sibling label."""
+    parent_text = None
+    if hasattr(widget, 'master'):
+        for child in widget.master.winfo_children():
+            if isinstance(child, ctk.CTkLabel):
+                parent_text = child.cget('text').lower()
+                break
+    
+    progress_color = colors.progress.bar
+    if parent_text:
+        if "cpu" in parent_text:
+            progress_color = colors.progress.cpu
+        elif "gpu" in parent_text or "igpu" in parent_text or "dgpu" in parent_text:
+            progress_color = colors.progress.gpu
+        elif "ram" in parent_text:
+            progress_color = colors.progress.ram
+        elif "temp" in parent_text:
+            progress_color = colors.progress.temp
+
+    kwargs["progress_color"] = progress_color
+    kwargs["fg_color"] = colors.progress.background
+
+# Color handlers of the widget classes that need more than the generic options,
+# looked up by exact type in _update_window_colors
+_COLOR_HANDLERS = {
+    ctk.CTkButton: _button_colors,
+    ctk.CTkProgressBar: _progressbar_colors,
+}
+
+# (attribute, label, unit) of the PowerProfile fields logged when a profile is applied
+_PROFILE_LOG_FIELDS = (
+    # AMD-specific parameters
+    ("stapm_limit", "STAPM Limit", " mW"),
+    ("fast_limit", "Fast Limit", " mW"),
+    ("slow_limit", "Slow Limit", " mW"),
+    ("tctl_temp", "TCTL Temp", "°C"),
+    ("vrm_current", "VRM Current", " mA"),
+    ("vrmmax_current", "VRM Max Current", " mA"),
+    ("vrmsoc_current", "VRM SoC Current", " mA"),
+    ("vrmsocmax_current", "VRM SoC Max Current", " mA"),
+    # Intel-specific parameters
+    ("pl1", "PL1", " W"),
+    ("pl2", "PL2", " W"),
+    ("tau", "Tau", " s"),
+    ("cpu_core_offset", "CPU Core Offset", " mV"),
+    ("gpu_core_offset", "GPU Core Offset", " mV"),
+    ("max_frequency", "Max Frequency", ""),
+)
+
+def _preload_icons() -> None:
+    """Decode the power profile icons ahead of widget creation."""
+    for name in _PROFILE_ICONS.values():
+        _get_icon(name, (24, 24))
+
+def _detect_model():
+    """Detect the laptop model, safe to call from a worker thread."""
+    # WMI goes through COM, which must be initialized on each thread using it
+    import pythoncom
+    pythoncom.CoInitialize()
+    try:
+        return ModelDetector().detect_model()
+    finally:
+        pythoncom.CoUninitialize()
 
+@lru_cache(maxsize=8)
 def load_custom_font(language_code: str = "en") -> tuple:
-    """Load custom font based on language and return font family name."""
+    """Load custom font based on language and return font family name.
+    
+    Memoized per language: fonts are registered once, later calls reuse the result.
+    """
     try:
         # Get the absolute path to the fonts using get_resource_path
         font_path = get_resource_path(os.path.join("fonts", "Ubuntu-Regular.ttf"))
@@ -78,11 +314,6 @@ def load_custom_font(language_code: str = "en") -> tuple:
 def install_system_fonts() -> None:
     """Install application fonts to Windows system if they don't exist."""
     try:
-        # Check for admin privileges
-        if not ctypes.windll.shell32.IsUserAnAdmin():
-            logger.info("Admin privileges required to install fonts")
-            return
-            
         # Get Windows Fonts directory
         windows_fonts_dir = Path(os.environ["WINDIR"]) / "Fonts"
             
@@ -98,28 +329,51 @@ def install_system_fonts() -> None:
             "klingon font.ttf": "Klingon (TrueType)"
         }
         
-        for font_file, reg_name in fonts_to_install.items():
-            font_path = app_fonts_dir / font_file
-            system_font_path = windows_fonts_dir / font_file
+        # Fast path: skip admin check and registry work when every font is already in place
+        def is_installed(font_file: str) -> bool:
+            try:
+                return (windows_fonts_dir / font_file).stat().st_size == (app_fonts_dir / font_file).stat().st_size
+            except OSError:
+                return False
+        
+        if all(is_installed(font_file) for font_file in fonts_to_install):
+            logger.debug("All fonts already installed")
+            return
+        
+        # Check for admin privileges
+        if not _IsUserAnAdmin():
+            logger.info("Admin privileges required to install fonts")
+            return
             
-            if not font_path.exists():
-                logger.warning(f"Font file not found: {font_file}")
-                continue
+        # Open the registry key once and read the installed font names up front
+        with winreg.OpenKey(
+            winreg.HKEY_LOCAL_MACHINE,
+            r"SOFTWARE\Microsoft\Windows NT\CurrentVersion\Fonts",
+            0,
+            winreg.KEY_READ | winreg.KEY_SET_VALUE
+        ) as key:
+            existing = {winreg.EnumValue(key, i)[0] for i in range(winreg.QueryInfoKey(key)[1])}
+            
+            for font_file, reg_name in fonts_to_install.items():
+                font_path = app_fonts_dir / font_file
+                system_font_path = windows_fonts_dir / font_file
                 
-            try:
+                if not font_path.exists():
+                    logger.warning(f"Font file not found: {font_file}")
+                    continue
+                    
                 # Check if font is already installed
-                with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Microsoft\Windows NT\CurrentVersion\Fonts", 0, winreg.KEY_READ) as key:
-                    winreg.QueryValueEx(key, reg_name)
-                logger.debug(f"Font already installed: {font_file}")
-            except FileNotFoundError:
+                if reg_name in existing:
+                    logger.debug(f"Font already installed: {font_file}")
+                    continue
+                    
                 try:
                     # Font not installed, copy it to Windows Fonts directory
                     logger.info(f"Installing font: {font_file}")
                     shutil.copy2(font_path, system_font_path)
                     
                     # Add font to registry
-                    with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Microsoft\Windows NT\CurrentVersion\Fonts", 0, winreg.KEY_SET_VALUE) as key:
-                        winreg.SetValueEx(key, reg_name, 0, winreg.REG_SZ, font_file)
+                    winreg.SetValueEx(key, reg_name, 0, winreg.REG_SZ, font_file)
                         
                     logger.info(f"Font installed successfully: {font_file}")
                 except PermissionError:
@@ -128,9 +382,7 @@ def install_system_fonts() -> None:
                     logger.error(f"Error installing font {font_file}: {e}")
                 
     except Exception as e:
-        logger.error(f"Error installing fonts: {e}")
-        import traceback
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.error("Error installing fonts: %s", e, exc_info=True)
 
 class FrameworkControlCenter(ctk.CTk):
     # Class-level variables for tray icon management
@@ -140,14 +392,33 @@ class FrameworkControlCenter(ctk.CTk):
     _last_notification_time = 0  # Track last notification time
     _notification_cooldown = 5  # Cooldown in seconds
     
+    # Map full model names to their (vendor section, model key) in profiles.json
+    _MODEL_PROFILE_SECTION = {
+        "Framework 16 AMD": ("amd_profiles", "16_AMD"),
+        "Framework 13 AMD": ("amd_profiles", "13_AMD"),
+        "Framework 13 Intel": ("intel_profiles", "13_INTEL"),
+    }
+    
+    # Decoded application logo, shared by the tray icon and all windows
+    _logo_image: Optional[Image.Image] = None
+    
+    # Parsed JSON files, reused until their mtime changes
+    _profiles_cache: Optional[dict] = None
+    _profiles_mtime: Optional[int] = None
+    _config_cache: Optional[dict] = None
+    _config_mtime: Optional[int] = None
+    _theme_index: dict[str, tuple[str, int]] = {}  # theme name -> (file stem, mtime)
+    
     def __init__(self):
         # Hide console window on Windows
         if sys.platform.startswith('win'):
-            import ctypes
-            ctypes.windll.user32.ShowWindow(ctypes.windll.kernel32.GetConsoleWindow(), 0)
+            _ShowWindow(_GetConsoleWindow(), 0)
         
         super().__init__()
         
+        # Tracked from the <Map>/<Unmap> events of the window, avoids querying Tk
+        self._visible = True
+        
         # Initialize event loop first
         self.loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self.loop)
@@ -156,33 +427,50 @@ class FrameworkControlCenter(ctk.CTk):
         if getattr(sys, 'frozen', False):
             os.chdir(os.path.dirname(sys.executable))
         
-        # Install system fonts if needed
-        install_system_fonts()
+        # Run independent I/O-bound startup work (font install, WMI model
+        # detection, icon decoding) in the background while the window is set up
+        startup_pool = ThreadPoolExecutor(max_workers=3)
+        startup_pool.submit(install_system_fonts)
+        detect_future = startup_pool.submit(_detect_model)
+        icons_future = startup_pool.submit(_preload_icons)
+        startup_pool.shutdown(wait=False)
         
         FrameworkControlCenter._open_windows.append(self)  # Add main window to list
         
         # Load configuration from settings.json
         self.config_path = Path("configs") / "settings.json"
         self.config = self._load_config()
+        self._last_config_hash = None  # Digest of the last written settings.json
+        self._save_pending_id = None  # Pending debounced config save
+        self._log_path_cache: Optional[tuple[date, Path]] = None  # Dated log file of the current day
         
         # Setup theme and colors
         self._setup_theme()
         
         # Configuration de la fenêtre
-        self.title("Framework Control Center")
+        self.title(get_text(self.config.language, "window_title"))
         self.geometry("300x700")  # Increased height from 650 to 700
         self.resizable(False, False)
         self.attributes('-topmost', True)  # Keep window on top when active
         
+        # DPI only changes on monitor reconfiguration, query it once
+        self._dpi_scale = self._compute_dpi_scale()
+        
+        # Last window position written, to skip unchanged saves
+        self._last_saved_pos = None
+        
+        # Pending debounced brightness update
+        self._brightness_after_id = None
+        
         # Configurer l'icône - Use absolute path and add delay
         try:
-            icon_path = os.path.abspath("assets/logo.ico")
-            if os.path.exists(icon_path):
+            icon_path = _LOGO_ICO
+            if _LOGO_EXISTS:
                 if sys.platform.startswith('win'):
                     self.after(500, lambda: self.iconbitmap(icon_path))
                 else:
                     self.iconbitmap(icon_path)
-                logger.info(f"Icon set successfully from: {icon_path}")
+                logger.info("Icon set successfully from: %s", icon_path)
             else:
                 logger.error(f"Icon file not found at: {icon_path}")
         except Exception as e:
@@ -193,14 +481,14 @@ class FrameworkControlCenter(ctk.CTk):
         
         # Bind minimize to tray for the window minimize button
         self.protocol("WM_DELETE_WINDOW", self._on_close)
-        self.bind("<Unmap>", lambda e: self._minimize_to_tray() if self.config.minimize_to_tray else None)
+        self.bind("<Map>", self._on_map)
+        self.bind("<Unmap>", self._on_unmap)
         
         # Positionner la fenêtre dans le coin inférieur droit
         self.after(1000, self._position_window)  # Delay window positioning
         
-        # Initialize model detection first
-        detector = ModelDetector()
-        self.model = detector.detect_model()
+        # Wait for model detection, required by everything below
+        self.model = detect_future.result()
         if not self.model:
             logger.error("No compatible Framework laptop detected")
             raise RuntimeError("No compatible Framework laptop detected")
@@ -215,12 +503,25 @@ class FrameworkControlCenter(ctk.CTk):
         self.display = DisplayManager(model=self.model)
 
         # Setup UI
+        icons_future.result()
+        self._widgets_by_role = defaultdict(list)  # Theme color role -> widgets, see _register_role
         self._create_widgets()
+        # Language the widget texts were last translated to
+        self._text_language = self.config.language
         self._setup_hotkeys()
         
+        # Run the event loop in a background thread so async work never blocks Tk
+        self._start_event_loop()
+        
         # Setup tray icon with delay
+        self.tray_icon = None
         self.after(1500, self._setup_tray)
 
+        # Fetch metrics continuously on the background loop, the Tk timer only
+        # picks up the latest snapshot
+        self._metrics_queue = queue.Queue(maxsize=1)
+        self._run_async(self._metrics_producer())
+        
         # Start monitoring with delay
         self.after(2000, lambda: self.after(self.config.monitoring_interval, self._update_metrics))
         
@@ -230,15 +531,81 @@ class FrameworkControlCenter(ctk.CTk):
         # Start log file check timer with delay
         self.after(3000, self._check_log_file_size)
 
+    def _start_event_loop(self) -> None:
+        """Start the asyncio event loop in a dedicated daemon thread."""
+        # Finished results waiting to be applied on the Tk thread
+        self._async_results = queue.SimpleQueue()
+        self._drain_scheduled = False
+        # Serializes winget upgrades across updates windows, created on the loop by its first user
+        self._update_lock = None
+        self._loop_thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self._loop_thread.start()
+
+    def _stop_event_loop(self) -> None:
+        """Cancel pending tasks and stop the background event loop."""
+        if not hasattr(self, 'loop') or not self.loop.is_running():
+            return
+        try:
+            for task in asyncio.all_tasks(self.loop):
+                self.loop.call_soon_threadsafe(task.cancel)
+        except RuntimeError:
+            # Task set changed while iterating, the loop is stopping anyway
+            pass
+        self.loop.call_soon_threadsafe(self.loop.stop)
+
+    def _run_async(self, coro, callback=None):
+        """Submit a coroutine to the background loop, callback gets its result on the Tk thread."""
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        if callback is not None:
+            future.add_done_callback(lambda f: self._on_async_done(f, callback))
+        return future
+
+    def _on_async_done(self, future, callback) -> None:
+        """Hand a finished background future over to the Tk thread."""
+        try:
+            result = future.result()
+        except Exception as e:
+            logger.error(f"Background task failed: {e}")
+            result = None
+        self._post_to_tk(callback, result)
+
+    def _post_to_tk(self, callback, result=None) -> None:
+        """Queue callback(result) to run on the Tk thread, from any thread."""
+        self._async_results.put((callback, result))
+        
+        # Wake Tk once for however many results pile up before it drains them
+        if not self._drain_scheduled:
+            self._drain_scheduled = True
+            try:
+                self.after(0, self._drain_async_results)
+            except RuntimeError:
+                # Window already destroyed, let the next result try again
+                self._drain_scheduled = False
+
+    def _drain_async_results(self) -> None:
+        """Apply all finished background results (runs on the Tk thread)."""
+        self._drain_scheduled = False
+        while True:
+            try:
+                callback, result = self._async_results.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                callback(result)
+            except Exception as e:
+                logger.error(f"Error applying background result: {e}")
+
     def _get_dpi_scale(self) -> float:
-        """Get the current DPI scale factor."""
+        """Get the cached DPI scale factor."""
+        return self._dpi_scale
+
+    def _compute_dpi_scale(self) -> float:
+        """Query the system DPI scale factor."""
         try:
-            import ctypes
-            user32 = ctypes.windll.user32
-            user32.SetProcessDPIAware()
+            _SetProcessDPIAware()
             awareness = ctypes.c_int()
-            ctypes.windll.shcore.GetProcessDpiAwareness(0, ctypes.byref(awareness))
-            dpi = user32.GetDpiForSystem()
+            _GetProcessDpiAwareness(None, ctypes.byref(awareness))
+            dpi = _GetDpiForSystem()
             return dpi / 96.0  # 96 is the base DPI
         except Exception as e:
             logger.error(f"Error getting DPI scale: {e}")
@@ -283,51 +650,51 @@ class FrameworkControlCenter(ctk.CTk):
             self.center_window()
 
     def _save_window_position(self) -> None:
-        """Save current window position to config."""
+        """Save current window position to config and confirm to the user."""
+        if self._save_window_position_silent():
+            # Show confirmation message
+            messagebox.showinfo(
+                get_text(self.config.language, "success"),
+                "Window position saved successfully"
+            )
+        else:
+            messagebox.showerror(
+                get_text(self.config.language, "error"),
+                "Failed to save window position"
+            )
+
+    def _save_window_position_silent(self) -> bool:
+        """Save current window position to config without any dialog.
+        
+        Returns:
+            bool: True if the position was saved, False otherwise
+        """
         try:
             # Get DPI scale
             dpi_scale = self._get_dpi_scale()
             
-            # Get window geometry
-            geometry = self.geometry()
-            # Parse geometry string (format: 'widthxheight+x+y')
-            x = int(geometry.split('+')[1])
-            y = int(geometry.split('+')[2])
+            # Get window position (read as integers, no geometry string parsing)
+            x = self.winfo_x()
+            y = self.winfo_y()
             
             # Convert physical coordinates to logical coordinates
             x = int(x * dpi_scale)
             y = int(y * dpi_scale)
             
+            # Nothing to write if the window did not move since the last save
+            if self._last_saved_pos == (x, y):
+                return True
+            self._last_saved_pos = (x, y)
+            
             # Update config
             self.config.window_position = {"x": x, "y": y}
-            self._save_config()
+            self._schedule_save()
             
-            # Show confirmation message
-            messagebox.showinfo(
-                get_text(self.config.language, "success"),
-                "Window position saved successfully"
-            )
-            
-            logger.debug(f"Window position saved: x={x}, y={y} (DPI scale: {dpi_scale})")
+            logger.debug("Window position saved: x=%s, y=%s (DPI scale: %s)", x, y, dpi_scale)
+            return True
         except Exception as e:
             logger.error(f"Error saving window position: {e}")
-            messagebox.showerror(
-                get_text(self.config.language, "error"),
-                "Failed to save window position"
-            )
-
-    def _start_drag(self, event) -> None:
-        """Start window drag."""
-        self._drag_start_x = event.x_root - self.winfo_x()
-        self._drag_start_y = event.y_root - self.winfo_y()
-
-    def _on_drag(self, event) -> None:
-        """Handle window drag."""
-        x = event.x_root - self._drag_start_x
-        y = event.y_root - self._drag_start_y
-        self.geometry(f"+{x}+{y}")
-        # Save position after drag
-        self._save_window_position()
+            return False
 
     def _setup_theme(self) -> None:
         """Setup the application theme."""
@@ -347,20 +714,21 @@ class FrameworkControlCenter(ctk.CTk):
             "refresh": None
         }
 
+    def _register_role(self, role: str, widget):
+        """Remember which theme color role a widget uses, returns the widget."""
+        self._widgets_by_role[role].append(widget)
+        return widget
+
     def _create_widgets(self) -> None:
         """Create all GUI widgets."""
         # Main container with dark background and rounded corners
-        self.container = ctk.CTkFrame(
+        self.container = self._register_role("bg_main", ctk.CTkFrame(
             self,
             fg_color=self.colors.background.main,
             corner_radius=10
-        )
+        ))
         self.container.pack(fill="both", expand=True, padx=0, pady=0)
 
-        # Create event loop for async operations
-        self.loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self.loop)
-
         # Power profiles
         self._create_power_profiles()
 
@@ -388,29 +756,25 @@ class FrameworkControlCenter(ctk.CTk):
         self._create_battery_status()
 
         # Additional buttons
-        buttons_frame = ctk.CTkFrame(self.container, fg_color=self.colors.background.main)
+        buttons_frame = self._register_role("bg_main", ctk.CTkFrame(self.container, fg_color=self.colors.background.main))
         buttons_frame.pack(fill="x", padx=10, pady=5)
 
     def _create_power_profiles(self) -> None:
         """Create power profile buttons."""
-        profiles_frame = ctk.CTkFrame(self.container, fg_color=self.colors.background.main)
+        profiles_frame = self._register_role("bg_main", ctk.CTkFrame(self.container, fg_color=self.colors.background.main))
         profiles_frame.pack(fill="x", padx=10, pady=5)
 
         # Créer un sous-frame pour les boutons avec distribution égale
-        buttons_frame = ctk.CTkFrame(profiles_frame, fg_color=self.colors.background.main)
+        buttons_frame = self._register_role("bg_main", ctk.CTkFrame(profiles_frame, fg_color=self.colors.background.main))
         buttons_frame.pack(fill="x", padx=5)
         buttons_frame.grid_columnconfigure((0, 1, 2), weight=1)
 
         # Charger les icônes
-        icons = {
-            "Silent": ctk.CTkImage(Image.open(get_resource_path("assets/eco.png")), size=(24, 24)),
-            "Balanced": ctk.CTkImage(Image.open(get_resource_path("assets/balanced.png")), size=(24, 24)),
-            "Boost": ctk.CTkImage(Image.open(get_resource_path("assets/performance.png")), size=(24, 24))
-        }
+        icons = {profile: _get_icon(name, (24, 24)) for profile, name in _PROFILE_ICONS.items()}
 
         self.profile_buttons = {}
         for i, profile in enumerate(["Silent", "Balanced", "Boost"]):
-            translated_text = get_text(self.config.language, f"power_profiles.{profile.lower()}")
+            translated_text = get_text(self.config.language, _PROFILE_TRANSLATION_KEY[profile])
             btn = ctk.CTkButton(
                 buttons_frame,
                 text=translated_text,
@@ -435,11 +799,11 @@ class FrameworkControlCenter(ctk.CTk):
 
     def _create_refresh_controls(self) -> None:
         """Create refresh rate control buttons."""
-        refresh_frame = ctk.CTkFrame(self.container, fg_color=self.colors.background.main)
+        refresh_frame = self._register_role("bg_main", ctk.CTkFrame(self.container, fg_color=self.colors.background.main))
         refresh_frame.pack(fill="x", padx=10, pady=5)
 
         # Create a sub-frame for buttons with equal distribution
-        buttons_frame = ctk.CTkFrame(refresh_frame, fg_color=self.colors.background.main)
+        buttons_frame = self._register_role("bg_main", ctk.CTkFrame(refresh_frame, fg_color=self.colors.background.main))
         buttons_frame.pack(fill="x", padx=5)
 
         # Get valid refresh rates from display manager
@@ -452,11 +816,7 @@ class FrameworkControlCenter(ctk.CTk):
 
         self.refresh_buttons = {}
         for i, mode in enumerate(refresh_rates):
-            # Convert mode to correct translation key format
-            mode_key = mode.lower()
-            if mode_key != "auto":
-                mode_key = f"{mode_key}hz"  # Add 'hz' suffix for numeric rates
-            translated_text = get_text(self.config.language, f"refresh_rates.{mode_key}")
+            translated_text = get_text(self.config.language, _refresh_translation_key(mode))
             
             btn = ctk.CTkButton(
                 buttons_frame,
@@ -480,12 +840,15 @@ class FrameworkControlCenter(ctk.CTk):
 
     def _create_metrics_display(self) -> None:
         """Create system metrics display."""
-        metrics_frame = ctk.CTkFrame(self.container, fg_color=self.colors.background.main)
+        metrics_frame = self._register_role("bg_main", ctk.CTkFrame(self.container, fg_color=self.colors.background.main))
         metrics_frame.pack(fill="x", padx=10, pady=5)
 
         # Create labels and progress bars for metrics
         self.metric_bars = {}
         self.metric_labels = {}
+        self.metric_vars = {}  # Label text variables, set directly on each update
+        self._metric_cfg: dict[str, MetricCfg] = {}  # Bar scaling and label format per metric, built once
+        self._last_metric_value: dict[str, float] = {}  # Last value shown, to skip no-op redraws
         
         # Métriques de base toujours affichées
         metrics = [
@@ -498,31 +861,44 @@ class FrameworkControlCenter(ctk.CTk):
 
         # Ajouter les métriques dGPU pour le modèle 16_AMD
         if self.model.has_dgpu:
-            logger.info(f"Detected {self.model.name} with dGPU, adding dGPU metrics to display")
+            logger.info("Detected %s with dGPU, adding dGPU metrics to display", self.model.name)
             metrics.extend([
                 ("dGPU", "dgpu_load", "%"),
                 ("dGPU TEMP", "dgpu_temp", "°C")
             ])
             logger.debug("Final metrics list: %s", metrics)
         else:
-            logger.info(f"Model {self.model.name} has no dGPU, skipping dGPU metrics")
+            logger.info("Model %s has no dGPU, skipping dGPU metrics", self.model.name)
 
         # Créer les widgets pour chaque métrique
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         for label, key, unit in metrics:
-            frame = ctk.CTkFrame(metrics_frame, fg_color=self.colors.background.main)
+            frame = self._register_role("bg_main", ctk.CTkFrame(metrics_frame, fg_color=self.colors.background.main))
             frame.pack(fill="x", pady=2)
 
-            # Label with value
+            # Label with value, bound to a StringVar so updates skip a widget configure
+            label_var = ctk.StringVar(value=f"{label}: 0{unit}")
             label_text = ctk.CTkLabel(
                 frame, 
                 text=f"{label}: 0{unit}", 
+                textvariable=label_var, 
                 text_color=self.colors.text.primary,
                 anchor="w",  # Align text to the left
                 width=150  # Fixed width for consistent alignment
             )
             label_text.pack(side="left", padx=5)
             self.metric_labels[key] = label_text
-            logger.debug(f"Created metric label: {label} -> {key}")
+            self.metric_vars[key] = label_var
+            is_temp = "temp" in key
+            self._metric_cfg[key] = MetricCfg(
+                # Temperatures map 40-100°C onto the bar, loads are already percentages
+                factor=1.67 / 100 if is_temp else 1 / 100,
+                bias=-40 * 1.67 / 100 if is_temp else 0.0,
+                clamp=is_temp,
+                fmt=f"{label}: {{:.1f}}{unit}"
+            )
+            if debug_enabled:
+                logger.debug("Created metric label: %s -> %s", label, key)
 
             # Progress bar
             progress = ctk.CTkProgressBar(
@@ -535,10 +911,12 @@ class FrameworkControlCenter(ctk.CTk):
             progress.pack(side="right", padx=5)
             progress.set(0)
             self.metric_bars[key] = progress
-            logger.debug(f"Created progress bar for: {key}")
+            self._register_role(_progress_role(label), progress)
+            if debug_enabled:
+                logger.debug("Created progress bar for: %s", key)
             
             # Add a small vertical spacer between metrics
-            spacer = ctk.CTkFrame(metrics_frame, fg_color=self.colors.background.main, height=2)
+            spacer = self._register_role("bg_main", ctk.CTkFrame(metrics_frame, fg_color=self.colors.background.main, height=2))
             spacer.pack(fill="x", pady=1)
 
     def _create_utility_buttons(self) -> None:
@@ -566,7 +944,7 @@ class FrameworkControlCenter(ctk.CTk):
 
     def _create_brightness_control(self) -> None:
         """Create brightness control slider."""
-        brightness_frame = ctk.CTkFrame(self.container, fg_color=self.colors.background.main)
+        brightness_frame = self._register_role("bg_main", ctk.CTkFrame(self.container, fg_color=self.colors.background.main))
         brightness_frame.pack(fill="x", padx=10, pady=10)
 
         label = ctk.CTkLabel(brightness_frame, text="BRIGHTNESS:", text_color=self.colors.text.primary)
@@ -600,57 +978,6 @@ class FrameworkControlCenter(ctk.CTk):
             logger.warning("Skipping metrics update - window destroyed or loop not initialized")
             return
 
-        async def update():
-            try:
-                metrics = await self.hardware.get_metrics()
-                logger.debug("Got metrics update")
-
-                # Update progress bars and labels
-                for key, bar in self.metric_bars.items():
-                    value = getattr(metrics, key, None)
-                    if value is not None:
-                        if "temp" in key:
-                            # Normalize temperature to 0-100 range for progress bar
-                            normalized = min(100, max(0, value - 40) * 1.67)
-                            bar.set(normalized / 100)
-                            
-                            # Format label based on temperature type
-                            if "cpu" in key:
-                                label_text = f"CPU TEMP: {value:.1f}°C"
-                            elif "igpu" in key:
-                                label_text = f"iGPU TEMP: {value:.1f}°C"
-                            elif "dgpu" in key:
-                                label_text = f"dGPU TEMP: {value:.1f}°C"
-                            else:
-                                label_text = f"{key.split('_')[0].upper()} TEMP: {value:.1f}°C"
-                            
-                            self.metric_labels[key].configure(text=label_text)
-                        else:
-                            # For load metrics
-                            bar.set(value / 100)
-                            
-                            # Format label based on load type
-                            if "cpu" in key:
-                                label_text = f"CPU: {value:.1f}%"
-                            elif "igpu" in key:
-                                label_text = f"iGPU: {value:.1f}%"
-                            elif "dgpu" in key:
-                                label_text = f"dGPU: {value:.1f}%"
-                            elif "ram" in key:
-                                label_text = f"RAM: {value:.1f}%"
-                            else:
-                                label_text = f"{key.split('_')[0].upper()}: {value:.1f}%"
-                            
-                            self.metric_labels[key].configure(text=label_text)
-
-                # Update battery indicator
-                self._update_battery_status(metrics)
-
-            except Exception as e:
-                logger.error(f"Error updating metrics: {e}")
-                import traceback
-                logger.error("Traceback: %s", traceback.format_exc())
-
         def schedule_next():
             """Schedule the next update if window still exists"""
             if self.winfo_exists():
@@ -660,8 +987,12 @@ class FrameworkControlCenter(ctk.CTk):
                 )
 
         try:
-            # Run the update coroutine
-            self.loop.run_until_complete(update())
+            # Apply the latest snapshot if the producer published a new one
+            try:
+                metrics = self._metrics_queue.get_nowait()
+            except queue.Empty:
+                metrics = None
+            self._apply_metrics(metrics)
             # Schedule next update
             schedule_next()
         except Exception as e:
@@ -669,6 +1000,67 @@ class FrameworkControlCenter(ctk.CTk):
             # Try to recover by scheduling next update
             schedule_next()
 
+    async def _metrics_producer(self) -> None:
+        """Keep the latest metrics snapshot available for the Tk thread.
+        
+        Runs on the background loop; fetches are naturally serialized, so
+        slow sensor reads never overlap.
+        """
+        while True:
+            try:
+                metrics = await self.hardware.get_metrics()
+                if metrics is not None:
+                    # Replace any snapshot the UI has not consumed yet
+                    try:
+                        self._metrics_queue.get_nowait()
+                    except queue.Empty:
+                        pass
+                    self._metrics_queue.put_nowait(metrics)
+            except Exception as e:
+                logger.error(f"Error fetching metrics: {e}")
+            await asyncio.sleep(self.config.monitoring_interval / 1000)
+
+    def _apply_metrics(self, metrics: Optional[HardwareMetrics]) -> None:
+        """Apply fetched metrics to the widgets (runs on the Tk thread)."""
+        if metrics is None or not self.winfo_exists():
+            return
+
+        try:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Got metrics update")
+
+            # Compute all changes first, then touch the widgets in a single pass
+            updates = []
+            for key, bar in self.metric_bars.items():
+                value = getattr(metrics, key, None)
+                if value is not None:
+                    # Skip Tk calls when the value did not visibly change
+                    prev = self._last_metric_value.get(key)
+                    if prev is not None and abs(prev - value) < 0.1:
+                        continue
+                    self._last_metric_value[key] = value
+
+                    cfg = self._metric_cfg[key]
+                    fraction = value * cfg.factor + cfg.bias
+                    if cfg.clamp:
+                        fraction = max(0.0, min(1.0, fraction))
+                    updates.append((bar, fraction, self.metric_vars[key], cfg.fmt.format(value)))
+
+            # Update progress bars and labels
+            for bar, fraction, label_var, text in updates:
+                bar.set(fraction)
+                label_var.set(text)
+
+            # Update battery indicator
+            self._update_battery_status(metrics)
+
+            # Flush all queued redraws at once
+            if updates:
+                self.update_idletasks()
+
+        except Exception as e:
+            logger.error("Error updating metrics: %s", e, exc_info=True)
+
     def _restart_metrics_update(self) -> None:
         """Restart the metrics update cycle with current interval."""
         try:
@@ -683,7 +1075,7 @@ class FrameworkControlCenter(ctk.CTk):
             
             # Start a new update cycle immediately
             self._update_metrics()
-            logger.info(f"Metrics update restarted with interval: {self.config.monitoring_interval}ms")
+            logger.info("Metrics update restarted with interval: %dms", self.config.monitoring_interval)
             
         except Exception as e:
             logger.error(f"Error restarting metrics update: {e}")
@@ -695,7 +1087,9 @@ class FrameworkControlCenter(ctk.CTk):
         try:
             # Update battery percentage and charging status
             status = f"BATTERY: {metrics.battery_percentage:.0f}% | {'AC' if metrics.is_charging else 'BATTERY'}"
-            self.battery_status.configure(text=status)
+            if status != self._last_battery_status:
+                self.battery_status_var.set(status)
+                self._last_battery_status = status
 
             # Update time remaining
             if metrics.is_charging:
@@ -707,21 +1101,30 @@ class FrameworkControlCenter(ctk.CTk):
             else:
                 time_text = "Time remaining: --:--"
             
-            self.battery_time.configure(text=time_text)
+            if time_text != self._last_battery_time:
+                self.battery_time_var.set(time_text)
+                self._last_battery_time = time_text
         except Exception as e:
             logger.error(f"Error updating battery status: {e}")
-            self.battery_status.configure(text="BATTERY: --% | --")
-            self.battery_time.configure(text="Time remaining: --:--")
+            self.battery_status_var.set("BATTERY: --% | --")
+            self.battery_time_var.set("Time remaining: --:--")
+            self._last_battery_status = None
+            self._last_battery_time = None
 
     def _on_brightness_change(self, value: float) -> None:
         """Handle brightness slider change."""
-        async def update_brightness():
-            await self.display.set_brightness(int(value))
-        
-        if hasattr(self, 'loop'):
-            self.loop.run_until_complete(update_brightness())
+        # Only send the last value of a drag to the display
+        if self._brightness_after_id is not None:
+            self.after_cancel(self._brightness_after_id)
+        self._brightness_after_id = self.after(80, self._apply_brightness, int(value))
         self.brightness_value.configure(text=f"ACTUEL: {int(value)}%")
 
+    def _apply_brightness(self, value: int) -> None:
+        """Apply the debounced brightness value on the background loop."""
+        self._brightness_after_id = None
+        if hasattr(self, 'loop'):
+            self._run_async(self.display.set_brightness(value))
+
     def _open_keyboard_config(self) -> None:
         """Open keyboard configuration website."""
         webbrowser.open("https://keyboard.frame.work/")
@@ -734,34 +1137,23 @@ class FrameworkControlCenter(ctk.CTk):
         """Open settings window."""
         self._create_settings_window()
 
-    def _toggle_window(self) -> None:
-        """Toggle window visibility."""
-        if self.winfo_viewable():
-            self.withdraw()
-            with self._tray_lock:
-                if self.tray_icon is not None:
-                    try:
-                        self.tray_icon.notify(
-                            title="Framework Control Center",
-                            message="Application minimized to tray"
-                        )
-                    except Exception as e:
-                        logger.error(f"Error showing tray notification: {e}")
-        else:
-            self.deiconify()
-            self.lift()
-
     def _on_close(self) -> None:
         """Gérer la fermeture de l'application."""
+        # Écrire une sauvegarde de configuration en attente
+        self._flush_pending_save()
+
         # Cleanup
         if hasattr(self.power, 'cleanup'):
             self.power.cleanup()
         
+        # Stop background event loop
+        self._stop_event_loop()
+        
         # Destroy window
         self.quit()
 
     def _quit_app(self) -> None:
-        """Quit the application."""
+        """Quit the application (called from the tray thread)."""
         try:
             # Stop the tray icon at class level
             with self._tray_lock:
@@ -773,44 +1165,62 @@ class FrameworkControlCenter(ctk.CTk):
                     FrameworkControlCenter._tray_instance = None
                     self.tray_icon = None
             
-            # Clean up async event loop
-            if hasattr(self, 'loop'):
-                try:
-                    pending = asyncio.all_tasks(self.loop)
-                    for task in pending:
-                        task.cancel()
-                    self.loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
-                    self.loop.close()
-                except Exception as e:
-                    logger.error(f"Error cleaning up async tasks: {e}")
-            
-            self.quit()
+            # La sauvegarde et l'arrêt de Tk se font sur le thread Tk
+            self.after(0, self._finish_quit)
         except Exception as e:
             logger.error(f"Error during application quit: {e}")
             # Forcer la fermeture en cas d'erreur
             self.quit()
 
+    def _finish_quit(self) -> None:
+        """Write pending settings and stop the application (runs on the Tk thread)."""
+        try:
+            self._flush_pending_save()
+            
+            # Clean up async event loop
+            try:
+                self._stop_event_loop()
+            except Exception as e:
+                logger.error(f"Error cleaning up async tasks: {e}")
+        finally:
+            self.quit()
+
     def _load_config(self) -> SystemConfig:
         """Load configuration from file."""
         try:
-            if self.config_path.exists():
-                with open(self.config_path, "r", encoding="utf-8") as f:
-                    config_data = json.load(f)
-                return SystemConfig(**config_data)
-            else:
+            try:
+                mtime = self.config_path.stat().st_mtime_ns
+            except FileNotFoundError:
                 logger.info("No configuration file found, using defaults")
                 return SystemConfig()
+            
+            cls = FrameworkControlCenter
+            if cls._config_cache is None or cls._config_mtime != mtime:
+                cls._config_cache = _load_json(self.config_path.read_bytes())
+                cls._config_mtime = mtime
+            return SystemConfig(**cls._config_cache)
         except Exception as e:
-            logger.error(f"Error loading configuration: {e}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.error("Error loading configuration: %s", e, exc_info=True)
             return SystemConfig()
 
-    def _create_default_icon(self) -> None:
+    @classmethod
+    def _get_logo(cls) -> Optional[Image.Image]:
+        """Return the decoded application logo, loading it from disk only once."""
+        if cls._logo_image is None:
+            if not _LOGO_EXISTS:
+                logger.error("Icon file not found: %s", _LOGO_ICO)
+                return None
+            with Image.open(_LOGO_ICO) as img:
+                img.load()
+                cls._logo_image = img.copy()
+        return cls._logo_image
+
+    def _create_default_icon(self) -> Image.Image:
         """Create a default tray icon."""
         try:
-            icon_path = Path("assets/logo.ico")
-            if icon_path.exists():
-                return Image.open(icon_path)
+            logo = self._get_logo()
+            if logo is not None:
+                return logo
         except Exception as e:
             logger.error(f"Failed to load icon: {e}")
             
@@ -819,203 +1229,193 @@ class FrameworkControlCenter(ctk.CTk):
         img.save("assets/icon.png")
         return img
 
+    def _get_profiles_config(self) -> Optional[dict]:
+        """Return the parsed profiles.json, re-reading it only when it changed."""
+        profiles_path = Path("configs/profiles.json")
+        try:
+            mtime = profiles_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+        
+        cls = FrameworkControlCenter
+        if cls._profiles_cache is None or cls._profiles_mtime != mtime:
+            cls._profiles_cache = _load_json(profiles_path.read_bytes())
+            cls._profiles_mtime = mtime
+        return cls._profiles_cache
+
+    def _get_theme_names(self) -> list[str]:
+        """Return the names of the available themes, from the theme index."""
+        return sorted(self._get_theme_index())
+
+    def _get_theme_index(self) -> dict[str, str]:
+        """Map theme names to their file stem, only re-parsing theme files whose mtime changed."""
+        cls = FrameworkControlCenter
+        known = {stem: (name, mtime) for name, (stem, mtime) in cls._theme_index.items()}
+        index = {}
+        with os.scandir("configs") as entries:
+            for entry in entries:
+                if not entry.name.endswith("_theme.json") or not entry.is_file():
+                    continue
+                stem = entry.name[:-len(".json")]
+                mtime = entry.stat().st_mtime_ns
+                cached = known.get(stem)
+                if cached is not None and cached[1] == mtime:
+                    name = cached[0]
+                else:
+                    name = _read_theme_name(entry.path)
+                index[name] = (stem, mtime)
+        cls._theme_index = index
+        return {name: stem for name, (stem, _) in index.items()}
+
     def _set_power_profile_sync(self, profile_name: str) -> None:
         """Synchronous wrapper for _set_power_profile."""
         try:
-            logger.info(f"Applying power profile: {profile_name}")
-            logger.debug(f"Current model: {self.model.name}")
-            
-            if not hasattr(self, 'loop'):
-                self.loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(self.loop)
+            logger.info("Applying power profile: %s", profile_name)
+            logger.debug("Current model: %s", self.model.name)
             
             # Load profile configuration
-            profiles_path = Path("configs/profiles.json")
-            if not profiles_path.exists():
+            config = self._get_profiles_config()
+            if config is None:
                 logger.error("Profiles configuration file not found")
                 return
 
-            with open(profiles_path) as f:
-                config = json.load(f)
-                logger.debug(f"Available AMD profiles: {list(config['amd_profiles'].keys())}")
-                
-                # Get the correct profile based on laptop model
-                model_name = str(self.model.name).strip()  # Ensure clean string
-                logger.debug(f"Cleaned model name: '{model_name}'")
-                
-                # Map full model names to profile keys
-                model_map = {
-                    "Framework 16 AMD": "16_AMD",
-                    "Framework 13 AMD": "13_AMD",
-                    "Framework 13 Intel": "13_INTEL"
-                }
-                
-                profile_key = model_map.get(model_name)
-                if not profile_key:
-                    logger.error(f"Unsupported model: '{model_name}'")
-                    return
-                
-                logger.debug(f"Using profile key: {profile_key}")
-                
-                if profile_key == "16_AMD":
-                    if profile_name.lower() not in config["amd_profiles"]["16_AMD"]:
-                        logger.error(f"Profile {profile_name} not found for 16_AMD")
-                        return
-                    profile_data = config["amd_profiles"]["16_AMD"][profile_name.lower()]
-                    logger.debug("Selected 16_AMD profile configuration")
-                elif profile_key == "13_AMD":
-                    if profile_name.lower() not in config["amd_profiles"]["13_AMD"]:
-                        logger.error(f"Profile {profile_name} not found for 13_AMD")
-                        return
-                    profile_data = config["amd_profiles"]["13_AMD"][profile_name.lower()]
-                    logger.debug("Selected 13_AMD profile configuration")
-                elif profile_key == "13_INTEL":
-                    if profile_name.lower() not in config["intel_profiles"]["13_INTEL"]:
-                        logger.error(f"Profile {profile_name} not found for 13_INTEL")
-                        return
-                    profile_data = config["intel_profiles"]["13_INTEL"][profile_name.lower()]
-                    logger.debug("Selected 13_INTEL profile configuration")
-                
-                logger.info(f"Profile configuration loaded: {profile_data}")
-                # Remove 'name' from profile_data if it exists to avoid duplicate
-                if 'name' in profile_data:
-                    del profile_data['name']
-                
-                # Add required parameters with default values based on profile
-                default_params = {
-                    'tdp': profile_data.get('stapm_limit', 45000) // 1000,  # Convert from mW to W
-                    'cpu_power': profile_data.get('fast_limit', 45000) // 1000,  # Convert from mW to W
-                    'gpu_power': 25,  # Default GPU power
-                    'boost_enabled': profile_name.lower() != 'silent',  # Disable boost only for silent profile
-                    'fan_mode': 'auto',  # Default fan mode
-                    'fan_curve': {  # Default fan curve
-                        '30': 0,
-                        '40': 10,
-                        '50': 20,
-                        '60': 40,
-                        '70': 60,
-                        '80': 80,
-                        '90': 100
-                    }
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Available AMD profiles: %s", list(config['amd_profiles']))
+            
+            # Get the correct profile based on laptop model
+            model_name = str(self.model.name).strip()  # Ensure clean string
+            profile_lower = profile_name.lower()
+            logger.debug("Cleaned model name: '%s'", model_name)
+            
+            section = self._MODEL_PROFILE_SECTION.get(model_name)
+            if not section:
+                logger.error("Unsupported model: '%s'", model_name)
+                return
+            
+            vendor_key, profile_key = section
+            logger.debug("Using profile key: %s", profile_key)
+            
+            profile_data = config[vendor_key][profile_key].get(profile_lower)
+            if profile_data is None:
+                logger.error("Profile %s not found for %s", profile_name, profile_key)
+                return
+            
+            logger.info("Profile configuration loaded: %s", profile_data)
+            # Work on a copy, the parsed file is cached and shared between calls
+            profile_data = dict(profile_data)
+            # Remove 'name' from profile_data if it exists to avoid duplicate
+            if 'name' in profile_data:
+                del profile_data['name']
+            
+            # Add required parameters with default values based on profile
+            default_params = {
+                'tdp': profile_data.get('stapm_limit', 45000) // 1000,  # Convert from mW to W
+                'cpu_power': profile_data.get('fast_limit', 45000) // 1000,  # Convert from mW to W
+                'gpu_power': 25,  # Default GPU power
+                'boost_enabled': profile_lower != 'silent',  # Disable boost only for silent profile
+                'fan_mode': 'auto',  # Default fan mode
+                'fan_curve': {  # Default fan curve
+                    '30': 0,
+                    '40': 10,
+                    '50': 20,
+                    '60': 40,
+                    '70': 60,
+                    '80': 80,
+                    '90': 100
                 }
-                
-                # Merge default params with profile data
-                profile_data.update(default_params)
-                
-                profile = PowerProfile(
-                    name=profile_name,
-                    **profile_data
-                )
+            }
             
-            # Log AMD-specific parameters
-            if hasattr(profile, 'stapm_limit'):
-                logger.info(f"STAPM Limit: {profile.stapm_limit} mW")
-            if hasattr(profile, 'fast_limit'):
-                logger.info(f"Fast Limit: {profile.fast_limit} mW")
-            if hasattr(profile, 'slow_limit'):
-                logger.info(f"Slow Limit: {profile.slow_limit} mW")
-            if hasattr(profile, 'tctl_temp'):
-                logger.info(f"TCTL Temp: {profile.tctl_temp}°C")
-            if hasattr(profile, 'vrm_current'):
-                logger.info(f"VRM Current: {profile.vrm_current} mA")
-            if hasattr(profile, 'vrmmax_current'):
-                logger.info(f"VRM Max Current: {profile.vrmmax_current} mA")
-            if hasattr(profile, 'vrmsoc_current'):
-                logger.info(f"VRM SoC Current: {profile.vrmsoc_current} mA")
-            if hasattr(profile, 'vrmsocmax_current'):
-                logger.info(f"VRM SoC Max Current: {profile.vrmsocmax_current} mA")
-            
-            # Log Intel-specific parameters
-            if hasattr(profile, 'pl1'):
-                logger.info(f"PL1: {profile.pl1} W")
-            if hasattr(profile, 'pl2'):
-                logger.info(f"PL2: {profile.pl2} W")
-            if hasattr(profile, 'tau'):
-                logger.info(f"Tau: {profile.tau} s")
-            if hasattr(profile, 'cpu_core_offset'):
-                logger.info(f"CPU Core Offset: {profile.cpu_core_offset} mV")
-            if hasattr(profile, 'gpu_core_offset'):
-                logger.info(f"GPU Core Offset: {profile.gpu_core_offset} mV")
-            if hasattr(profile, 'max_frequency'):
-                logger.info(f"Max Frequency: {profile.max_frequency}")
-            
-            # Apply profile
-            success = self.loop.run_until_complete(self.power.apply_profile(profile))
+            # Merge default params with profile data
+            profile_data.update(default_params)
             
-            if success:
-                logger.info(f"Successfully applied power profile: {profile_name}")
-                self.config.current_profile = profile_name
-                
-                # Update button states
-                if profile_name in self.profile_buttons:
-                    self._update_button_state("profile", self.profile_buttons[profile_name])
-                    logger.debug(f"Updated button state for profile: {profile_name}")
-                
-                # Show notification if minimized
-                if not self.winfo_viewable():
-                    with self._tray_lock:
-                        if self.tray_icon is not None:
-                            try:
-                                self.tray_icon.notify(
-                                    title="Profile Changed",
-                                    message=f"Power profile changed to {profile_name}"
-                                )
-                            except Exception as e:
-                                logger.error(f"Error showing tray notification: {e}")
-            else:
-                logger.error(f"Failed to apply power profile: {profile_name}")
+            profile = PowerProfile(
+                name=profile_name,
+                **profile_data
+            )
+            
+            # Log the vendor-specific parameters that are set on this profile
+            if logger.isEnabledFor(logging.INFO):
+                fields = profile.additional_settings
+                for name, label, unit in _PROFILE_LOG_FIELDS:
+                    value = fields.get(name)
+                    if value is not None:
+                        logger.info("%s: %s%s", label, value, unit)
+            
+            # Apply profile on the background loop, the UI is updated once it completes
+            self._run_async(
+                self.power.apply_profile(profile),
+                lambda success: self._on_power_profile_applied(profile_name, success)
+            )
                 
         except Exception as e:
-            logger.error(f"Error setting power profile: {e}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.error("Error setting power profile: %s", e, exc_info=True)
+
+    def _on_power_profile_applied(self, profile_name: str, success: Optional[bool]) -> None:
+        """Update the UI after a power profile was applied (runs on the Tk thread)."""
+        if not success:
+            logger.error("Failed to apply power profile: %s", profile_name)
+            return
+        
+        logger.info("Successfully applied power profile: %s", profile_name)
+        self.config.current_profile = profile_name
+        
+        # Update button states
+        if profile_name in self.profile_buttons:
+            self._update_button_state("profile", self.profile_buttons[profile_name])
+            logger.debug("Updated button state for profile: %s", profile_name)
+        
+        # Show notification if minimized
+        if not self._visible:
+            self._notify_tray("Profile Changed", f"Power profile changed to {profile_name}")
 
     def _set_refresh_rate_sync(self, mode: str) -> None:
         """Synchronous wrapper for _set_refresh_rate."""
-        if hasattr(self, 'loop'):
-            self.loop.run_until_complete(self._set_refresh_rate(mode))
-
-    async def _set_refresh_rate(self, mode: str) -> None:
-        """Set display refresh rate."""
-        try:
-            # Get max rate based on model
-            max_rate = "165" if "16" in self.model.name else "60"
-            
-            # Process mode
-            if mode == "Auto":
-                actual_mode = "auto"
-            else:
-                # Clean up mode if it already has Hz
-                actual_mode = mode.replace("Hz", "")
-            
-            logger.debug(f"Setting refresh rate: mode={actual_mode}, max_rate={max_rate}")
-            success = await self.display.set_refresh_rate(actual_mode, max_rate)
+        if not hasattr(self, 'loop'):
+            return
             
-            if success:
-                self.config.refresh_rate_mode = mode
-                
-                # Update button states
-                if mode in self.refresh_buttons:
-                    self._update_button_state("refresh", self.refresh_buttons[mode])
-                
-                # Show notification if minimized
-                if not self.winfo_viewable():
-                    with self._tray_lock:
-                        if self.tray_icon is not None:
-                            try:
-                                self.tray_icon.notify(
-                                    title="Refresh Rate Changed",
-                                    message=f"Display refresh rate mode changed to {mode}"
-                                )
-                            except Exception as e:
-                                logger.error(f"Error showing tray notification: {e}")
-            else:
-                logger.error(f"Failed to set refresh rate to {mode}")
+        try:
+            # Apply on the background loop, the UI is updated once it completes
+            self._run_async(
+                self._set_refresh_rate(mode),
+                lambda success: self._on_refresh_rate_applied(mode, success)
+            )
                 
         except Exception as e:
-            logger.error(f"Error setting refresh rate: {e}")
-            import traceback
-            logger.error("Traceback: %s", traceback.format_exc())
+            logger.error("Error setting refresh rate: %s", e, exc_info=True)
+
+    def _on_refresh_rate_applied(self, mode: str, success: Optional[bool]) -> None:
+        """Update the UI after the refresh rate was changed (runs on the Tk thread)."""
+        if not success:
+            logger.error("Failed to set refresh rate to %s", mode)
+            return
+        
+        self.config.refresh_rate_mode = mode
+        
+        # Update button states
+        if mode in self.refresh_buttons:
+            self._update_button_state("refresh", self.refresh_buttons[mode])
+        
+        # Show notification if minimized
+        if not self._visible:
+            self._notify_tray("Refresh Rate Changed", f"Display refresh rate mode changed to {mode}")
+
+    async def _set_refresh_rate(self, mode: str) -> bool:
+        """Set display refresh rate.
+        
+        Runs on the background loop, so it must not touch any widget.
+        """
+        # Get max rate based on model
+        max_rate = "165" if "16" in self.model.name else "60"
+        
+        # Process mode
+        if mode == "Auto":
+            actual_mode = "auto"
+        else:
+            # Clean up mode if it already has Hz
+            actual_mode = mode.replace("Hz", "")
+        
+        logger.debug("Setting refresh rate: mode=%s, max_rate=%s", actual_mode, max_rate)
+        return await self.display.set_refresh_rate(actual_mode, max_rate)
 
     def _setup_tray(self) -> None:
         """Setup system tray icon and menu."""
@@ -1027,35 +1427,11 @@ class FrameworkControlCenter(ctk.CTk):
 
             try:
                 import pystray
-                from PIL import Image
-                import sys
-                import os
-
-                # Get the correct path for the icon file
-                if getattr(sys, 'frozen', False):
-                    # If the application is run from the exe
-                    base_path = sys._MEIPASS
-                else:
-                    # If the application is run from a Python interpreter
-                    base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-
-                # Create tray icon
-                icon_path = os.path.join(base_path, "assets", "logo.ico")
-                logger.debug(f"Looking for icon at: {icon_path}")
-                
-                if not os.path.exists(icon_path):
-                    logger.error("Icon file not found: %s", icon_path)
-                    # Create a default icon as fallback
-                    img = Image.new("RGB", (64, 64), self.colors.primary)
-                    fallback_path = os.path.join(base_path, "assets", "icon.png")
-                    os.makedirs(os.path.dirname(fallback_path), exist_ok=True)
-                    img.save(fallback_path)
-                    icon_path = fallback_path
 
                 # Create the icon instance
                 icon = pystray.Icon(
                     name="Framework CC",
-                    icon=Image.open(icon_path),
+                    icon=self._create_default_icon(),
                     title="Framework Control Center",
                     menu=pystray.Menu(
                         pystray.MenuItem("Show/Hide", self._toggle_window),
@@ -1071,34 +1447,38 @@ class FrameworkControlCenter(ctk.CTk):
                 threading.Thread(target=self.tray_icon.run, daemon=True).start()
 
             except Exception as e:
-                logger.error(f"Error setting up tray icon: {e}")
-                import traceback
-                logger.error(f"Traceback: {traceback.format_exc()}")
+                logger.error("Error setting up tray icon: %s", e, exc_info=True)
                 FrameworkControlCenter._tray_instance = None
                 self.tray_icon = None
 
     def _create_battery_status(self) -> None:
         """Create battery status display."""
-        battery_frame = ctk.CTkFrame(self.container, fg_color=self.colors.background.main)
+        battery_frame = self._register_role("bg_main", ctk.CTkFrame(self.container, fg_color=self.colors.background.main))
         battery_frame.pack(fill="x", padx=10, pady=5)
 
         # Battery percentage and charging status
+        self.battery_status_var = ctk.StringVar(value="BATTERY: --% | --")
         self.battery_status = ctk.CTkLabel(
             battery_frame,
-            text="BATTERY: --% | --",
+            textvariable=self.battery_status_var,
             text_color=self.colors.text.primary,
             font=("Roboto", 11)
         )
         self.battery_status.pack(side="top", pady=(0, 2))
 
         # Battery time remaining
+        self.battery_time_var = ctk.StringVar(value="Time remaining: --:--")
         self.battery_time = ctk.CTkLabel(
             battery_frame,
-            text="Time remaining: --:--",
+            textvariable=self.battery_time_var,
             text_color=self.colors.text.primary,
             font=("Roboto", 11)
         )
         self.battery_time.pack(side="top")
+        
+        # Last texts shown, to skip re-configuring identical labels
+        self._last_battery_status = None
+        self._last_battery_time = None
 
     def _setup_hotkeys(self) -> None:
         """Setup global hotkeys."""
@@ -1107,9 +1487,14 @@ class FrameworkControlCenter(ctk.CTk):
 
     def _update_button_state(self, button_type: str, active_button: ctk.CTkButton) -> None:
         """Update button states when a new button becomes active."""
+        previous = self.active_buttons[button_type]
+        # Already the active button, its style is up to date
+        if previous is active_button:
+            return
+
         # Réinitialiser l'ancien bouton actif
-        if self.active_buttons[button_type]:
-            self.active_buttons[button_type].configure(
+        if previous:
+            previous.configure(
                 border_color=self.colors.border.inactive,
                 text_color=self.colors.text.primary,
                 fg_color=self.colors.button.primary
@@ -1128,26 +1513,24 @@ class FrameworkControlCenter(ctk.CTk):
     def _update_window_text(self) -> None:
         """Update all window text with current language."""
         try:
+            lang = self.config.language
+            
             # Update window title
-            self.title(get_text(self.config.language, "window_title"))
+            self.title(get_text(lang, "window_title"))
             
             # Update profile buttons if they exist
             if hasattr(self, 'profile_buttons') and self.profile_buttons:
-                for profile in self.profile_buttons:
-                    button = self.profile_buttons[profile]
-                    translated_text = get_text(self.config.language, f"power_profiles.{profile.lower()}")
-                    button.configure(text=translated_text)
+                for profile, button in self.profile_buttons.items():
+                    translated_text = get_text(lang, _PROFILE_TRANSLATION_KEY[profile])
+                    if button.cget("text") != translated_text:
+                        button.configure(text=translated_text)
             
             # Update refresh rate buttons if they exist
             if hasattr(self, 'refresh_buttons') and self.refresh_buttons:
-                for mode in self.refresh_buttons:
-                    button = self.refresh_buttons[mode]
-                    # Convert mode to correct translation key format
-                    mode_key = mode.lower()
-                    if mode_key != "auto":
-                        mode_key = f"{mode_key}hz"  # Add 'hz' suffix for numeric rates
-                    translated_text = get_text(self.config.language, f"refresh_rates.{mode_key}")
-                    button.configure(text=translated_text)
+                for mode, button in self.refresh_buttons.items():
+                    translated_text = get_text(lang, _refresh_translation_key(mode))
+                    if button.cget("text") != translated_text:
+                        button.configure(text=translated_text)
             
             # Update utility buttons if they exist
             if hasattr(self, 'keyboard_button'):
@@ -1157,26 +1540,25 @@ class FrameworkControlCenter(ctk.CTk):
             if hasattr(self, 'settings_button'):
                 self.settings_button.configure(text=get_text(self.config.language, "utility_buttons.settings"))
             
-            logger.debug("Window text updated to language: " + self.config.language)
+            self._text_language = self.config.language
+            logger.debug("Window text updated to language: %s", self.config.language)
             
         except Exception as e:
-            logger.error(f"Error updating window text: {e}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.error("Error updating window text: %s", e, exc_info=True)
 
     def _initialize_default_profiles(self) -> None:
         """Initialize default power and refresh rate profiles at startup."""
         try:
-            # Set Balanced power profile
+            # Set Balanced power profile and Auto refresh rate, both are applied
+            # on the background loop so this returns immediately
             self._set_power_profile_sync("Balanced")
-            
-            # Set Auto refresh rate
             self._set_refresh_rate_sync("Auto")
             
-            logger.info("Default profiles initialized: Balanced power profile and Auto refresh rate")
+            logger.info("Default profiles requested: Balanced power profile and Auto refresh rate")
             
-            # Update window text with current language
-            self._update_window_text()
+            # Widgets are built in the configured language, only retranslate if it changed since
+            if self._text_language != self.config.language:
+                self._update_window_text()
             
         except Exception as e:
             logger.error(f"Error initializing default profiles: {e}")
@@ -1187,61 +1569,56 @@ class FrameworkControlCenter(ctk.CTk):
             # Update configuration
             self.config.language = value
             
+            # Drop memoized translations so the switch always starts from the tables
+            get_text.cache_clear()
+            
             # Save configuration immediately
-            self._save_config()
+            self._schedule_save()
             
             # Update font when language changes
             self.current_font = load_custom_font(value)
             
-            # Update all open windows
-            for window in FrameworkControlCenter._open_windows:
-                if window.winfo_exists():
-                    if hasattr(window, 'current_font'):
-                        window.current_font = self.current_font
-                    if hasattr(window, '_update_window_text'):
-                        window._update_window_text()
-                    if hasattr(window, '_update_widgets_font'):
-                        window._update_widgets_font()
-                else:
-                    FrameworkControlCenter._open_windows.remove(window)
+            # Drop closed windows, then update the ones still open
+            open_windows = FrameworkControlCenter._open_windows
+            open_windows[:] = [w for w in open_windows if w.winfo_exists()]
+            for window in open_windows:
+                if hasattr(window, 'current_font'):
+                    window.current_font = self.current_font
+                if hasattr(window, '_update_window_text'):
+                    window._update_window_text()
+                if hasattr(window, '_update_widgets_font'):
+                    window._update_widgets_font()
                     
             logger.info(f"Language changed to: {value}")
             
         except Exception as e:
-            logger.error(f"Error changing language: {e}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.error("Error changing language: %s", e, exc_info=True)
 
     def _update_widgets_font(self) -> None:
         """Update font in all widgets."""
-        def update_widget_font(widget):
+        # Use the font name from current_font, and its size as default
+        if isinstance(self.current_font, tuple):
+            font_name, default_size = self.current_font[0], self.current_font[1]
+        else:
+            font_name, default_size = self.current_font, 10
+
+        # Walk the widget tree iteratively instead of recursing
+        stack = [self]
+        while stack:
+            widget = stack.pop()
             try:
-                if hasattr(widget, 'cget') and 'font' in widget.keys():
+                if 'font' in _widget_keys(widget):
                     current_font = widget.cget('font')
-                    if isinstance(current_font, tuple):
-                        # Keep the current font size if it's explicitly set
-                        size = current_font[1]
-                        weight = current_font[2] if len(current_font) > 2 else "normal"
-                    else:
-                        # Use the default size from the custom font
-                        if isinstance(self.current_font, tuple):
-                            size = self.current_font[1]
-                        else:
-                            size = 10
-                        weight = "normal"
-                    
-                    # Use the font name from current_font
-                    font_name = self.current_font[0] if isinstance(self.current_font, tuple) else self.current_font
-                    widget.configure(font=(font_name, size))
-                
-                # Recursively update child widgets
-                for child in widget.winfo_children():
-                    update_widget_font(child)
+                    # Keep the current font size if it's explicitly set
+                    size = current_font[1] if isinstance(current_font, tuple) else default_size
+                    new_font = (font_name, size)
+                    if current_font != new_font:
+                        widget.configure(font=new_font)
+
+                stack.extend(widget.winfo_children())
             except Exception as e:
                 logger.error(f"Error updating font for widget: {e}")
 
-        update_widget_font(self)
-
     def _create_settings_window(self) -> None:
         """Create settings window."""
         if hasattr(self, 'settings_window') and self.settings_window.winfo_exists():
@@ -1258,9 +1635,9 @@ class FrameworkControlCenter(ctk.CTk):
         
         try:
             if sys.platform.startswith('win'):
-                self.settings_window.after(200, lambda: self.settings_window.iconbitmap(str(Path("assets/logo.ico").absolute())))
+                self.settings_window.after(200, lambda: self.settings_window.iconbitmap(_LOGO_ICO))
             else:
-                self.settings_window.iconbitmap(str(Path("assets/logo.ico")))
+                self.settings_window.iconbitmap(_LOGO_ICO)
         except Exception as e:
             logger.error(f"Failed to set window icon: {e}")
         
@@ -1278,12 +1655,8 @@ class FrameworkControlCenter(ctk.CTk):
         theme_label.pack(anchor="w", pady=(0, 5))
         
         # Get available themes
-        themes = []
         try:
-            for theme_file in Path("configs").glob("*_theme.json"):
-                with open(theme_file, encoding="utf-8") as f:
-                    theme_data = json.load(f)
-                    themes.append(theme_data["name"])
+            themes = self._get_theme_names()
         except Exception as e:
             logger.error(f"Error loading themes: {e}")
             themes = ["Default Dark", "Light Theme"]
@@ -1364,6 +1737,7 @@ class FrameworkControlCenter(ctk.CTk):
             corner_radius=6
         )
         start_windows_check.pack(anchor="w", pady=(0, 15))
+        self._start_with_windows_checkbox = start_windows_check
 
         # Monitoring interval
         interval_label = ctk.CTkLabel(
@@ -1422,13 +1796,7 @@ class FrameworkControlCenter(ctk.CTk):
         """Save settings to config file."""
         try:
             # Find theme file by name
-            theme_file = None
-            for theme_path in Path("configs").glob("*_theme.json"):
-                with open(theme_path, encoding="utf-8") as f:
-                    theme_data = json.load(f)
-                    if theme_data["name"] == theme:
-                        theme_file = theme_path.stem
-                        break
+            theme_file = self._get_theme_index().get(theme)
             
             if theme_file:
                 # Update config values
@@ -1459,7 +1827,7 @@ class FrameworkControlCenter(ctk.CTk):
                     self.config.monitoring_interval = 1000  # Default to 1 second
 
                 # Save to file
-                self._save_config()
+                self._schedule_save()
                 
                 # Apply settings immediately
                 if minimize_to_tray and not hasattr(self, '_tray_icon'):
@@ -1474,6 +1842,7 @@ class FrameworkControlCenter(ctk.CTk):
 
                 # Update language
                 self.current_font = load_custom_font(language)
+                get_text.cache_clear()
                 self._update_widgets_font()
                 self._update_window_text()
 
@@ -1491,8 +1860,7 @@ class FrameworkControlCenter(ctk.CTk):
                 )
                 
         except Exception as e:
-            logger.error(f"Error saving settings: {e}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.error("Error saving settings: %s", e, exc_info=True)
             messagebox.showerror(
                 get_text(self.config.language, "error"),
                 get_text(self.config.language, "settings_save_error")
@@ -1529,62 +1897,86 @@ class FrameworkControlCenter(ctk.CTk):
 
             if success:
                 self.config.start_with_windows = value
-                self._save_config()
+                self._schedule_save()
                 logger.info(f"Start with Windows {'enabled' if value else 'disabled'}")
             else:
                 logger.error("Failed to update start with Windows setting")
                 # Revert checkbox if operation failed
-                if hasattr(self, 'settings_window') and self.settings_window.winfo_exists():
-                    for widget in self.settings_window.winfo_children():
-                        if isinstance(widget, ctk.CTkCheckBox) and widget.cget("text") == get_text("start_with_windows", self.config.language):
-                            widget.deselect() if value else widget.select()
+                checkbox = getattr(self, '_start_with_windows_checkbox', None)
+                if checkbox is not None and checkbox.winfo_exists():
+                    checkbox.deselect() if value else checkbox.select()
         except Exception as e:
             logger.error(f"Error updating start with Windows setting: {e}")
 
     def _check_log_file_size(self) -> None:
-        """Periodically check and rotate log file if needed."""
+        """Periodically check and rotate log file if needed.
+        
+        The application log already rotates on write through its
+        RotatingFileHandler, this is only a safety net for the dated log file.
+        """
         try:
-            log_file = Path("logs") / f"{datetime.now().strftime('%Y-%m-%d')}.log"
-            check_and_rotate_log(log_file)
+            # Rebuild the dated log path only when the day changes
+            today = date.today()
+            if self._log_path_cache is None or self._log_path_cache[0] != today:
+                self._log_path_cache = (today, Path("logs") / f"{today.isoformat()}.log")
+            check_and_rotate_log(self._log_path_cache[1])
         except Exception as e:
             logger.error(f"Error checking log file size: {e}")
         finally:
-            # Schedule next check in 5 minutes
-            self.after(300000, self._check_log_file_size)
-
-    def _save_config(self) -> None:
+            # Schedule next check in 1 hour
+            self.after(3600000, self._check_log_file_size)
+
+    def _schedule_save(self) -> None:
+        """Save the configuration shortly, coalescing bursts of settings changes into one write."""
+        if self._save_pending_id is not None:
+            self.after_cancel(self._save_pending_id)
+        self._save_pending_id = self.after(250, self._save_config_now)
+
+    def _flush_pending_save(self) -> None:
+        """Write a scheduled configuration save right away."""
+        if self._save_pending_id is not None:
+            self.after_cancel(self._save_pending_id)
+            self._save_config_now()
+
+    def _save_config_now(self) -> None:
         """Save configuration to file."""
+        self._save_pending_id = None
         try:
+            data = _dump_json(self.config.model_dump())
+            
+            # Nothing changed since the last save, skip the disk write
+            digest = hashlib.blake2b(data, digest_size=8).digest()
+            if digest == self._last_config_hash:
+                return
+            
             # Ensure config directory exists
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Save configuration
-            with open(self.config_path, "w", encoding="utf-8") as f:
-                json.dump(self.config.dict(), f, indent=4)
+            # Write to a temp file and swap it in so a crash never leaves a truncated config
+            tmp_path = self.config_path.with_suffix(".json.tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.config_path)
+            self._last_config_hash = digest
                 
-            logger.debug(f"Configuration saved to {self.config_path}")
+            logger.debug("Configuration saved to %s", self.config_path)
         except Exception as e:
-            logger.error(f"Error saving configuration: {e}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.error("Error saving configuration: %s", e, exc_info=True)
 
     def _on_theme_change(self, theme_name: str) -> None:
         """Handle theme change."""
         try:
             # Find theme file by name
-            theme_file = None
-            for theme_path in Path("configs").glob("*_theme.json"):
-                with open(theme_path, encoding="utf-8") as f:
-                    theme_data = json.load(f)
-                    if theme_data["name"] == theme_name:
-                        theme_file = theme_path.stem
-                        break
+            theme_file = self._get_theme_index().get(theme_name)
             
             if theme_file:
                 # Update configuration
                 self.config.current_theme = theme_file
                 
                 # Save configuration
-                self._save_config()
+                self._schedule_save()
                 
                 # Load and apply new theme
                 theme = self.config.load_theme()
@@ -1593,89 +1985,75 @@ class FrameworkControlCenter(ctk.CTk):
                 self.spacing = theme.spacing
                 self.radius = theme.radius
                 
-                # Update all windows
-                for window in FrameworkControlCenter._open_windows:
-                    if window.winfo_exists():
-                        if hasattr(window, 'colors'):
-                            window.colors = self.colors
-                        window._update_window_colors()
-                    else:
-                        FrameworkControlCenter._open_windows.remove(window)
+                # Drop closed windows, then update the ones still open
+                open_windows = FrameworkControlCenter._open_windows
+                open_windows[:] = [w for w in open_windows if w.winfo_exists()]
+                for window in open_windows:
+                    if hasattr(window, 'colors'):
+                        window.colors = self.colors
+                    window._update_window_colors()
                 
                 logger.info(f"Theme changed to: {theme_name}")
             
         except Exception as e:
-            logger.error(f"Error changing theme: {e}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.error("Error changing theme: %s", e, exc_info=True)
 
     def _update_window_colors(self) -> None:
         """Update colors in all widgets."""
+        colors = self.colors
+        progress_bg = colors.progress.background
+        role_colors = {
+            "bg_main": {"fg_color": colors.background.main},
+            "progress_cpu": {"progress_color": colors.progress.cpu, "fg_color": progress_bg},
+            "progress_gpu": {"progress_color": colors.progress.gpu, "fg_color": progress_bg},
+            "progress_ram": {"progress_color": colors.progress.ram, "fg_color": progress_bg},
+            "progress_temp": {"progress_color": colors.progress.temp, "fg_color": progress_bg},
+            "progress_bar": {"progress_color": colors.progress.bar, "fg_color": progress_bg},
+        }
+
+        # Widgets registered at creation get their colors straight from their role
+        role_options = {}
+        for role, widgets in getattr(self, '_widgets_by_role', {}).items():
+            options = role_colors[role]
+            for widget in widgets:
+                role_options[widget] = options
+
         def update_widget_colors(widget):
             try:
+                # Collect every option change and apply them in a single configure call
+                options = role_options.get(widget)
+                is_registered = options is not None
+                kwargs = dict(options) if is_registered else {}
+                keys = _widget_keys(widget)
+
                 # Update background color
-                if hasattr(widget, 'configure') and 'fg_color' in widget.keys():
+                if not is_registered and 'fg_color' in keys:
                     current_color = widget.cget('fg_color')
                     if current_color == "#1E1E1E":  # Old main background
-                        widget.configure(fg_color=self.colors.background.main)
+                        kwargs["fg_color"] = colors.background.main
                     elif current_color == "#2D2D2D":  # Old secondary background
-                        widget.configure(fg_color=self.colors.background.secondary)
+                        kwargs["fg_color"] = colors.background.secondary
                     elif current_color == "#FF7043":  # Old primary color
-                        widget.configure(fg_color=self.colors.button.primary)
+                        kwargs["fg_color"] = colors.button.primary
 
                 # Update text color
-                if hasattr(widget, 'configure') and 'text_color' in widget.keys():
-                    widget.configure(text_color=self.colors.text.primary)
-
-                # Update button colors
-                if isinstance(widget, ctk.CTkButton):
-                    if widget.cget('text') == "×":  # Close button
-                        widget.configure(
-                            fg_color=self.colors.button.danger,
-                            hover_color=self.colors.status.error,
-                            text_color=self.colors.text.primary
-                        )
-                    else:
-                        widget.configure(
-                            fg_color=self.colors.button.primary,
-                            hover_color=self.colors.hover,
-                            text_color=self.colors.text.primary
-                        )
-
-                # Update progress bars
-                if isinstance(widget, ctk.CTkProgressBar):
-                    parent_text = None
-                    if hasattr(widget, 'master'):
-                        for child in widget.master.winfo_children():
-                            if isinstance(child, ctk.CTkLabel):
-                                parent_text = child.cget('text').lower()
-                                break
-                    
-                    progress_color = self.colors.progress.bar
-                    if parent_text:
-                        if "cpu" in parent_text:
-                            progress_color = self.colors.progress.cpu
-                        elif "gpu" in parent_text or "igpu" in parent_text or "dgpu" in parent_text:
-                            progress_color = self.colors.progress.gpu
-                        elif "ram" in parent_text:
-                            progress_color = self.colors.progress.ram
-                        elif "temp" in parent_text:
-                            progress_color = self.colors.progress.temp
-
-                    widget.configure(
-                        progress_color=progress_color,
-                        fg_color=self.colors.progress.background
-                    )
+                if 'text_color' in keys:
+                    kwargs["text_color"] = colors.text.primary
+
+                # Update button and progress bar colors (registered widgets already have theirs)
+                handler = _COLOR_HANDLERS.get(type(widget))
+                if handler is not None and not (is_registered and handler is _progressbar_colors):
+                    handler(widget, colors, kwargs)
 
                 # Update borders
-                if hasattr(widget, 'configure') and 'border_color' in widget.keys():
+                if 'border_color' in keys:
                     if widget.cget('border_color') == "#FFFFFF":  # Old active border
-                        widget.configure(border_color=self.colors.border.active)
+                        kwargs["border_color"] = colors.border.active
                     else:
-                        widget.configure(border_color=self.colors.border.inactive)
+                        kwargs["border_color"] = colors.border.inactive
 
                 # Update font sizes
-                if hasattr(widget, 'configure') and 'font' in widget.keys():
+                if 'font' in keys:
                     current_font = widget.cget('font')
                     if isinstance(current_font, tuple):
                         family = current_font[0]
@@ -1687,7 +2065,10 @@ class FrameworkControlCenter(ctk.CTk):
                                 size = self.theme_fonts.main.size.normal
                         else:
                             size = self.theme_fonts.main.size.normal
-                        widget.configure(font=(family, size))
+                        kwargs["font"] = (family, size)
+
+                if kwargs:
+                    widget.configure(**kwargs)
 
                 # Recursively update child widgets
                 for child in widget.winfo_children():
@@ -1696,8 +2077,10 @@ class FrameworkControlCenter(ctk.CTk):
                 logger.error(f"Error updating colors for widget: {e}")
 
         # Update main window
-        self.configure(fg_color=self.colors.background.main)
+        self.configure(fg_color=colors.background.main)
         update_widget_colors(self)
+        # Redraw once after all widgets were reconfigured
+        self.update_idletasks()
 
     def _minimize_to_tray(self) -> None:
         """Minimize window to system tray."""
@@ -1705,32 +2088,56 @@ class FrameworkControlCenter(ctk.CTk):
 
     def _toggle_window(self) -> None:
         """Toggle window visibility."""
-        if self.winfo_viewable():
+        if self._visible:
             self.withdraw()
-            with self._tray_lock:
-                if self.tray_icon is not None:
-                    try:
-                        self.tray_icon.notify(
-                            title="Framework Control Center",
-                            message="Application minimized to tray"
-                        )
-                    except Exception as e:
-                        logger.error(f"Error showing tray notification: {e}")
+            self._notify_tray("Framework Control Center", "Application minimized to tray")
         else:
             self.deiconify()
             self.lift()
 
+    def _on_map(self, event) -> None:
+        """Remember the window is shown, however it was restored."""
+        if event.widget is self:
+            self._visible = True
+
+    def _on_unmap(self, event) -> None:
+        """Remember the window is hidden, including title bar and taskbar minimizes."""
+        # Les enfants émettent aussi <Unmap>, seule la fenêtre principale compte
+        if event.widget is not self:
+            return
+        self._visible = False
+        if self.config.minimize_to_tray:
+            self._minimize_to_tray()
+
+    def _notify_tray(self, title: str, message: str) -> None:
+        """Show a tray notification if the tray icon is running."""
+        # Cheap check first, only take the lock when there is something to notify
+        if self.tray_icon is None:
+            return
+        with self._tray_lock:
+            if self.tray_icon is not None:
+                try:
+                    self.tray_icon.notify(title=title, message=message)
+                except Exception as e:
+                    logger.error(f"Error showing tray notification: {e}")
+
     def on_closing(self) -> None:
         """Handle window closing."""
         try:
+            self._flush_pending_save()
+
             # Cancel any pending metrics update
             if hasattr(self, '_metrics_after_id'):
                 self.after_cancel(self._metrics_after_id)
                 delattr(self, '_metrics_after_id')
 
-            # Close event loop
+            # Stop and close event loop
             if hasattr(self, 'loop'):
-                self.loop.close()
+                self._stop_event_loop()
+                if hasattr(self, '_loop_thread'):
+                    self._loop_thread.join(timeout=2.0)
+                if not self.loop.is_running():
+                    self.loop.close()
                 delattr(self, 'loop')
 
             # Destroy window
@@ -1742,6 +2149,12 @@ class FrameworkControlCenter(ctk.CTk):
 
 
 class UpdatesManager(ctk.CTkToplevel):
+    # Last winget scan, reused for this many seconds before winget is queried again
+    _UPDATE_CACHE_PATH = Path("configs") / "winget_cache.json"
+    _UPDATE_CACHE_TTL = 300
+    # Whether Get-WinGetPackage can be used, None until it was first tried
+    _winget_module_available: Optional[bool] = None
+
     def __init__(self, parent):
         super().__init__(parent)
         FrameworkControlCenter._open_windows.append(self)  # Add window to list
@@ -1757,9 +2170,9 @@ class UpdatesManager(ctk.CTkToplevel):
         # Configurer l'icône
         try:
             if sys.platform.startswith('win'):
-                self.after(200, lambda: self.iconbitmap(str(Path("assets/logo.ico").absolute())))
+                self.after(200, lambda: self.iconbitmap(_LOGO_ICO))
             else:
-                self.iconbitmap(str(Path("assets/logo.ico")))
+                self.iconbitmap(_LOGO_ICO)
         except Exception as e:
             logger.error(f"Failed to set window icon: {e}")
         
@@ -1767,6 +2180,21 @@ class UpdatesManager(ctk.CTkToplevel):
         self.packages = {
             'winget': []
         }
+        self._package_rows: list[PackageRow] = []  # Every package of the list, in display order
+        self._row_index: dict[str, PackageRow] = {}  # Same rows by package name
+        self._checked: dict[str, bool] = {}  # Selection of the upgradable packages, by name
+        self._row_pool = []  # Recycled row widgets, only enough to fill the viewport
+        self._rows_by_var: dict[str, ctk.CTkFrame] = {}  # Pool row of each checkbox variable, by Tcl name
+        self._syncing_rows = False  # Checkbox variables are being set from _checked, not by the user
+        self._visible_rows = 0
+        self._first_row = 0
+        self._log_queue = deque()  # Log messages waiting for the next flush
+        
+        # Configure processes to hide their window, shared by every winget call (only read by subprocess)
+        self._hidden_startupinfo = subprocess.STARTUPINFO()
+        self._hidden_startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+        self._hidden_startupinfo.wShowWindow = subprocess.SW_HIDE
+        self._log_flush_scheduled = False
         
         # Créer l'interface
         self._create_widgets()
@@ -1863,21 +2291,29 @@ class UpdatesManager(ctk.CTkToplevel):
         header_frame.grid_columnconfigure(2, weight=1)  # Version actuelle
         header_frame.grid_columnconfigure(3, weight=1)  # Nouvelle version
         
+        # Styles partagés par les cases et libellés de chaque ligne, calculés une seule fois
+        colors = self.colors
+        self._checkbox_style = {
+            "text": "",
+            "width": 20,
+            "height": 20,
+            "checkbox_width": 20,
+            "checkbox_height": 20,
+            "corner_radius": 5,
+            "fg_color": colors.button.primary,
+            "hover_color": colors.hover,
+            "border_color": colors.border.inactive,
+        }
+        self._label_style = {"text": "", "text_color": colors.text.primary}
+        self._success_style = {"text_color": colors.status.success, "anchor": "e"}  # Vert
+        
         # Checkbox "Select All"
         self.select_all_var = ctk.BooleanVar()
         select_all = ctk.CTkCheckBox(
             header_frame,
-            text="",
             variable=self.select_all_var,
             command=self._toggle_all_packages,
-            width=20,
-            height=20,
-            checkbox_width=20,
-            checkbox_height=20,
-            corner_radius=5,
-            fg_color=self.colors.button.primary,
-            hover_color=self.colors.hover,
-            border_color=self.colors.border.inactive
+            **self._checkbox_style
         )
         select_all.grid(row=0, column=0, sticky="w", padx=10, pady=5)
         
@@ -1911,16 +2347,27 @@ class UpdatesManager(ctk.CTkToplevel):
             width=100
         ).grid(row=0, column=3, sticky="e", padx=10, pady=5)
         
-        # Liste des paquets avec scrollbar et style amélioré
-        self.packages_list = ctk.CTkScrollableFrame(
+        # Liste des paquets avec scrollbar : seules les lignes visibles existent,
+        # elles sont réutilisées pendant le défilement
+        self.packages_list = ctk.CTkFrame(
             packages_frame,
             fg_color=self.colors.background.secondary,
-            label_text="",
-            label_fg_color=self.colors.background.main,
             corner_radius=10
         )
         self.packages_list.pack(fill="both", expand=True, padx=5, pady=5)
         
+        self._packages_scrollbar = ctk.CTkScrollbar(self.packages_list, command=self._on_packages_scroll)
+        self._packages_scrollbar.pack(side="right", fill="y", padx=(0, 5), pady=5)
+        
+        self._rows_frame = ctk.CTkFrame(self.packages_list, fg_color="transparent")
+        self._rows_frame.pack(side="left", fill="both", expand=True, padx=5, pady=5)
+        self._rows_frame.pack_propagate(False)
+        self._rows_frame.grid_propagate(False)
+        self._rows_frame.grid_columnconfigure(0, weight=1)
+        self._rows_frame.bind("<Configure>", self._on_packages_resize)
+        # Every widget of the window carries the toplevel in its bindtags
+        self.bind("<MouseWheel>", self._on_packages_wheel)
+        
         # Frame pour les logs (30% de la largeur)
         logs_frame = ctk.CTkFrame(main_frame, fg_color=self.colors.background.main)
         logs_frame.grid(row=0, column=1, sticky="nsew")
@@ -1955,7 +2402,7 @@ class UpdatesManager(ctk.CTkToplevel):
         check_button = ctk.CTkButton(
             bottom_buttons,
             text="Check installed apps",
-            command=lambda: threading.Thread(target=self._check_updates, daemon=True).start(),
+            command=self._check_updates,
             height=35,
             fg_color=self.colors.button.primary,
             hover_color=self.colors.hover,
@@ -1981,7 +2428,7 @@ class UpdatesManager(ctk.CTkToplevel):
         refresh_button = ctk.CTkButton(
             bottom_buttons,
             text="Refresh List",
-            command=lambda: threading.Thread(target=self._check_updates, daemon=True).start(),
+            command=self._check_updates,
             height=35,
             fg_color=self.colors.button.primary,
             hover_color=self.colors.hover,
@@ -1990,6 +2437,186 @@ class UpdatesManager(ctk.CTkToplevel):
         )
         refresh_button.pack(side="left", padx=5)
 
+    def _create_package_row(self, index: int) -> ctk.CTkFrame:
+        """Create a row widget of the pool, bound to a package later by _bind_package_row."""
+        package_frame = ctk.CTkFrame(self._rows_frame, fg_color="transparent", height=_PACKAGE_ROW_HEIGHT - 4)
+        package_frame.grid(row=index, column=0, sticky="ew", pady=2)
+        package_frame.grid_propagate(False)
+        package_frame.grid_rowconfigure(0, weight=1)
+        package_frame.grid_columnconfigure(0, weight=0)  # Checkbox
+        package_frame.grid_columnconfigure(1, weight=2)  # Nom (plus large)
+        package_frame.grid_columnconfigure(2, weight=1)  # Version actuelle
+        package_frame.grid_columnconfigure(3, weight=1)  # Flèche et nouvelle version
+        
+        # Checkbox pour la sélection (colonne 0)
+        checkbox_var = ctk.BooleanVar()
+        checkbox_var.trace_add("write", self._on_package_checked)
+        self._rows_by_var[str(checkbox_var)] = package_frame
+        checkbox = ctk.CTkCheckBox(
+            package_frame,
+            variable=checkbox_var,
+            **self._checkbox_style
+        )
+        checkbox.grid(row=0, column=0, sticky="w", padx=5)
+        
+        # Nom du paquet (colonne 1)
+        label_style = self._label_style
+        name_label = ctk.CTkLabel(
+            package_frame,
+            anchor="w",
+            width=200,  # Largeur fixe pour le nom
+            **label_style
+        )
+        name_label.grid(row=0, column=1, sticky="w", padx=5)
+        
+        # Version actuelle (colonne 2)
+        current_label = ctk.CTkLabel(
+            package_frame,
+            anchor="e",
+            width=100,  # Largeur fixe pour la version
+            **label_style
+        )
+        current_label.grid(row=0, column=2, sticky="e", padx=5)
+        
+        # Flèche et nouvelle version dans un seul libellé (colonne 3), masqué pour les paquets à jour
+        update_label = ctk.CTkLabel(
+            package_frame,
+            text="",
+            width=120,  # Largeur fixe pour la version
+            **self._success_style
+        )
+        update_label.grid(row=0, column=3, sticky="e", padx=5)
+        
+        # Stocker les références dans le frame
+        package_frame.checkbox = checkbox_var
+        package_frame.checkbox_widget = checkbox
+        package_frame.name_label = name_label
+        package_frame.current_label = current_label
+        package_frame.update_label = update_label
+        package_frame.package = None
+        package_frame.package_name = None
+        package_frame.shown = True
+        return package_frame
+
+    def _bind_package_row(self, package_frame: ctk.CTkFrame, package: PackageRow) -> None:
+        """Show a package in a recycled row widget."""
+        package_frame.checkbox.set(self._checked.get(package.name, False))
+        # La ligne affiche déjà ce paquet, seule la case peut avoir changé
+        if package_frame.package is package:
+            return
+        
+        previous = package_frame.package
+        package_frame.package = package
+        package_frame.package_name = package.name
+        package_frame.name_label.configure(text=package.name)
+        package_frame.current_label.configure(text=package.current)
+        if package.new:
+            package_frame.update_label.configure(text=f"→ {package.new}")
+        
+        # Activer la checkbox seulement si une mise à jour est disponible
+        upgradable = bool(package.new)
+        if previous is None or bool(previous.new) != upgradable:
+            if upgradable:
+                package_frame.update_label.grid()
+                package_frame.checkbox_widget.configure(state="normal")
+            else:
+                package_frame.update_label.grid_remove()
+                package_frame.checkbox_widget.configure(state="disabled")
+
+    def _render_packages(self) -> None:
+        """Bind the visible slice of the package list to the row pool."""
+        rows = self._package_rows
+        total = len(rows)
+        visible = self._visible_rows
+        first = max(0, min(self._first_row, total - visible))
+        self._first_row = first
+        
+        # Les cases sont mises à jour depuis _checked, la trace ne doit pas les recopier
+        self._syncing_rows = True
+        try:
+            for index, package_frame in enumerate(self._row_pool):
+                # Ne toucher à la géométrie que si la ligne change de visibilité
+                show = index < visible and first + index < total
+                if show:
+                    self._bind_package_row(package_frame, rows[first + index])
+                if show != package_frame.shown:
+                    package_frame.grid() if show else package_frame.grid_remove()
+                    package_frame.shown = show
+        finally:
+            self._syncing_rows = False
+        
+        if total > visible:
+            self._packages_scrollbar.set(first / total, (first + visible) / total)
+        else:
+            self._packages_scrollbar.set(0.0, 1.0)
+
+    def _set_packages(self, rows: list[PackageRow]) -> None:
+        """Replace the package list, keeping the selection of packages that are still upgradable.
+        
+        The scroll position is kept (clamped to the new length), rows reused from the
+        previous list are not rebound by _render_packages.
+        """
+        self._package_rows = rows
+        self._row_index = {row.name: row for row in rows}
+        self._checked = {row.name: self._checked.get(row.name, False) for row in rows if row.new}
+        self._render_packages()
+
+    def _row_pitch(self) -> int:
+        """Height in pixels of a package row, pady included, at the current widget scaling."""
+        # CTk scales the row height and its grid pady, the viewport height is in real pixels
+        return max(1, round(_PACKAGE_ROW_HEIGHT * ctk.ScalingTracker.get_widget_scaling(self)))
+
+    def _on_packages_resize(self, event) -> None:
+        """Grow the row pool to fill the new viewport height."""
+        visible = max(1, event.height // self._row_pitch())
+        if visible == self._visible_rows:
+            return
+        self._visible_rows = visible
+        self._grow_row_pool()
+
+    def _grow_row_pool(self) -> None:
+        """Create the missing pool rows a few at a time, letting Tk paint between batches."""
+        pool = self._row_pool
+        target = min(self._visible_rows, len(pool) + _ROW_POOL_BATCH)
+        while len(pool) < target:
+            pool.append(self._create_package_row(len(pool)))
+        self._render_packages()
+        if len(pool) < self._visible_rows:
+            self.after_idle(self._grow_row_pool)
+
+    def _on_packages_scroll(self, action: str, value: str, unit: Optional[str] = None) -> None:
+        """Handle the scrollbar commands (moveto / scroll units|pages)."""
+        if action == "moveto":
+            first = round(float(value) * len(self._package_rows))
+        else:
+            step = int(value) * (self._visible_rows if unit == "pages" else 1)
+            first = self._first_row + step
+        
+        # Un glissement de la barre émet de nombreux moveto pour la même ligne
+        first = max(0, min(first, len(self._package_rows) - self._visible_rows))
+        if first == self._first_row:
+            return
+        self._first_row = first
+        self._render_packages()
+
+    def _on_packages_wheel(self, event) -> None:
+        """Scroll the package list with the mouse wheel when the pointer is over it."""
+        widget_path, list_path = str(event.widget), str(self.packages_list)
+        # Le CTkScrollbar gère déjà la molette lui-même
+        scrollbar_path = str(self._packages_scrollbar)
+        if widget_path == scrollbar_path or widget_path.startswith(scrollbar_path + "."):
+            return
+        if widget_path == list_path or widget_path.startswith(list_path + "."):
+            self._on_packages_scroll("scroll", str(-int(event.delta / 120) * 3), "units")
+
+    def _on_package_checked(self, var_name: str, *_) -> None:
+        """Remember the selection of a row so it survives recycling (shared variable trace)."""
+        if self._syncing_rows:
+            return
+        package_frame = self._rows_by_var.get(var_name)
+        if package_frame is not None and package_frame.package_name in self._checked:
+            self._checked[package_frame.package_name] = package_frame.checkbox.get()
+
     def _on_close(self):
         """Gérer la fermeture propre de la fenêtre."""
         try:
@@ -2000,328 +2627,424 @@ class UpdatesManager(ctk.CTkToplevel):
             logger.error(f"Error closing Update Manager: {e}")
             self.destroy()
 
-    def _check_updates(self) -> None:
-        """Vérifier les mises à jour disponibles."""
+    def _check_updates(self, use_cache: bool = True, keep_rows: bool = False) -> None:
+        """Vérifier les mises à jour disponibles.
+        
+        Runs on the Tk thread: a recent cached scan is shown right away and winget is
+        queried by _check_updates_worker, whose result is applied back on this thread.
+        With keep_rows the current list stays on screen and is updated in place.
+        """
         try:
             # Nettoyer la liste des paquets
-            for widget in self.packages_list.winfo_children():
-                widget.destroy()
+            if not keep_rows:
+                self._set_packages([])
             
             # Effacer les logs existants
+            self._log_queue.clear()
             self.log_text.delete("1.0", "end")
             
             # Ajouter un message de démarrage dans les logs
             self._add_log("Checking for system updates...\n")
             
-            self._check_winget_updates()
+            entry = self._load_update_cache()
+            cached = None
+            if use_cache and entry is not None and time.time() - entry["ts"] < self._UPDATE_CACHE_TTL:
+                cached = entry["installed"], entry["updates"]
+                self._add_log("Showing cached package list, refreshing...\n")
+                self._show_packages(*cached)
+            
+            threading.Thread(target=self._check_updates_worker, args=(cached, entry), daemon=True).start()
                 
         except Exception as e:
             self._add_log(f"Error checking updates: {str(e)}\n")
             logger.error(f"Error checking updates: {e}")
 
-    def _check_winget_updates(self) -> None:
-        """Vérifier les mises à jour winget."""
+    def _check_updates_worker(self, cached: Optional[tuple[dict, dict]], known: Optional[dict]) -> None:
+        """Query winget in the background and hand the packages over to the Tk thread.
+        
+        known is the last cache entry: when winget prints the same output again its
+        packages are reused instead of being parsed.
+        """
         try:
-            # Configure process to hide window
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            startupinfo.wShowWindow = subprocess.SW_HIDE
-            
-            # Liste des paquets installés
-            process = subprocess.run(
-                ["winget", "list", "--accept-source-agreements", "--disable-interactivity"],
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                startupinfo=startupinfo
-            )
-            
-            if process.returncode != 0:
-                raise ValueError(f"winget list failed: {process.stderr}")
-            
-            self._add_log("Scanning installed packages...\n")
-            
-            # Parser la sortie pour extraire les paquets installés
-            installed = {}
-            lines = process.stdout.split('\n')
-            
-            # Chercher la ligne d'en-tête (plusieurs formats possibles)
-            header_index = -1
-            for i, line in enumerate(lines):
-                if any(all(col in line for col in combo) for combo in [
-                    ["Name", "Id", "Version"],  # Format standard
-                    ["Nom", "ID", "Version"],   # Format français
-                    ["名称", "ID", "版"]      # Format autres langues
-                ]):
-                    header_index = i
-                    break
-            
-            if header_index == -1:
-                # Essayer une autre commande
-                process = subprocess.run(
-                    ["winget", "list", "--source", "winget", "--accept-source-agreements"],
-                    capture_output=True,
-                    text=True,
-                    encoding='utf-8',
-                    startupinfo=startupinfo
-                )
-                lines = process.stdout.split('\n')
-                for i, line in enumerate(lines):
-                    if any(all(col in line for col in combo) for combo in [
-                        ["Name", "Id", "Version"],
-                        ["Nom", "ID", "Version"],
-                        ["名称", "ID", "版本"]
-                    ]):
-                        header_index = i
-                        break
-            
-            if header_index == -1:
-                self._add_log("Warning: Could not parse winget list output format\n")
-                self._add_log("Raw output:\n" + process.stdout + "\n")
-                return
+            startupinfo = self._hidden_startupinfo
             
-            # Extraire les positions des colonnes
-            header = lines[header_index]
-            # Chercher les colonnes dans différentes langues
-            name_pos = max(header.find("Name"), header.find("Nom"), header.find("名称"))
-            id_pos = max(header.find("Id"), header.find("ID"), header.find("标识符"))
-            version_pos = max(header.find("Version"), header.find("版本"))
-            
-            # Parser les paquets installés
-            for line in lines[header_index + 2:]:  # Skip header and separator
-                if line.strip() and not line.startswith("-"):
-                    try:
-                        if len(line) > version_pos:
-                            name = line[name_pos:id_pos].strip()
-                            version = line[version_pos:].strip().split()[0]
-                            if name and version:
-                                installed[name] = version
-                    except Exception as e:
-                        logger.debug(f"Failed to parse line: {line}, error: {e}")
-                        continue
-            
-            self._add_log(f"Found {len(installed)} installed packages\n")
-            self._add_log("Checking for updates...\n")
-            
-            # Vérifier les mises à jour disponibles
-            process = subprocess.run(
-                ["winget", "upgrade", "--include-unknown", "--disable-interactivity", "--accept-source-agreements"],
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                startupinfo=startupinfo
-            )
-            
-            if process.returncode != 0:
-                raise ValueError(f"winget upgrade check failed: {process.stderr}")
-            
-            # Parser la sortie des mises à jour
-            updates = {}
-            lines = process.stdout.split('\n')
-            
-            # Chercher la ligne d'en-tête
-            header_index = -1
-            for i, line in enumerate(lines):
-                if any(all(col in line for col in combo) for combo in [
-                    ["Name", "Version", "Available"],
-                    ["Nom", "Version", "Disponible"],
-                    ["名称", "版本", "可用"]
-                ]):
-                    header_index = i
-                    break
-            
-            if header_index != -1:
-                # Extraire les positions des colonnes
-                header = lines[header_index]
-                name_pos = max(header.find("Name"), header.find("Nom"), header.find("名称"))
-                version_pos = header.find("Version")
-                available_pos = max(header.find("Available"), header.find("Disponible"), header.find("可用"))
-                
-                # Parser les mises à jour disponibles
-                for line in lines[header_index + 2:]:  # Skip header and separator
-                    if line.strip() and not line.startswith("-"):
-                        try:
-                            if len(line) > available_pos:
-                                name = line[name_pos:version_pos].strip()
-                                current = line[version_pos:available_pos].strip()
-                                new = line[available_pos:].strip()
-                                if name and current and new:
-                                    updates[name] = (current, new)
-                        except Exception as e:
-                            logger.debug(f"Failed to parse update line: {line}, error: {e}")
-                            continue
-            
-            # Afficher d'abord les paquets avec des mises à jour
-            for name, (current, new) in updates.items():
-                self._add_package_to_list(name, current, new)
-                self._add_log(f"Update available: {name} ({current} → {new})\n")
-            
-            # Puis afficher les autres paquets installés
-            for name, version in installed.items():
-                if name not in updates:
-                    self._add_package_to_list(name, version, None)
-            
-            self._add_log(f"\nFound {len(updates)} updates available.\n")
+            # Structured output from the WinGet PowerShell module, text parsing otherwise
+            result = self._query_winget_json(startupinfo, known)
+            if result is None:
+                result = self._parse_winget_text(startupinfo, known)
+                if result is None:
+                    return
+            installed, updates, digest = result
+            self._save_update_cache(installed, updates, digest)
+            self.parent._post_to_tk(lambda result: self._check_updates_apply(result, cached), (installed, updates))
             
         except Exception as e:
             self._add_log(f"Error: {str(e)}\n")
-            logger.error(f"Error checking winget updates: {e}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
-
-    def _add_package_to_list(
-        self,
-        name: str,
-        current_version: str,
-        new_version: Optional[str]
-    ) -> None:
-        """Ajouter un paquet à la liste avec son statut de mise à jour."""
-        # Frame pour le paquet avec fond transparent
-        package_frame = ctk.CTkFrame(self.packages_list, fg_color="transparent")
-        package_frame.pack(fill="x", padx=5, pady=2)
-        package_frame.grid_columnconfigure(0, weight=0)  # Checkbox
-        package_frame.grid_columnconfigure(1, weight=2)  # Nom (plus large)
-        package_frame.grid_columnconfigure(2, weight=1)  # Version actuelle
-        package_frame.grid_columnconfigure(3, weight=1)  # Flèche et nouvelle version
-        
-        # Checkbox pour la sélection (colonne 0)
-        checkbox_var = ctk.BooleanVar()
-        checkbox = ctk.CTkCheckBox(
-            package_frame,
-            text="",
-            variable=checkbox_var,
-            width=20,
-            height=20,
-            checkbox_width=20,
-            checkbox_height=20,
-            corner_radius=5,
-            fg_color=self.colors.button.primary,
-            hover_color=self.colors.hover,
-            border_color=self.colors.border.inactive
+            logger.error("Error checking winget updates: %s", e, exc_info=True)
+
+    def _check_updates_apply(self, result: tuple[dict, dict], cached: Optional[tuple[dict, dict]]) -> None:
+        """Show the packages found by _check_updates_worker (runs on the Tk thread)."""
+        # La fenêtre a pu être fermée pendant le scan winget
+        if not self.winfo_exists():
+            return
+        if result == cached:
+            self._add_log("Package list is up to date.\n")
+            return
+        self._show_packages(*result)
+
+    def _show_packages(self, installed: dict, updates: dict) -> None:
+        """Fill the packages list, packages with an update first.
+        
+        Packages whose versions did not change keep their PackageRow, only the
+        rows of added or upgraded packages are redrawn.
+        """
+        known = self._row_index
+        
+        def package_row(name: str, current: str, new: Optional[str]) -> PackageRow:
+            row = known.get(name)
+            if row is not None and row.current == current and row.new == new:
+                return row
+            return PackageRow(name, current, new)
+        
+        # Afficher d'abord les paquets avec des mises à jour
+        rows = []
+        for name, (current, new) in updates.items():
+            rows.append(package_row(name, current, new))
+            self._add_log(f"Update available: {name} ({current} → {new})\n")
+        
+        # Puis afficher les autres paquets installés
+        for name, version in installed.items():
+            if name not in updates:
+                rows.append(package_row(name, version, None))
+        
+        self._set_packages(rows)
+        self._add_log(f"\nFound {len(updates)} updates available.\n")
+
+    def _load_update_cache(self) -> Optional[dict]:
+        """Return the last winget scan (ts, digest, installed, updates), or None if there is none."""
+        try:
+            cache = _load_json(self._UPDATE_CACHE_PATH.read_bytes())
+            cache["updates"] = {name: tuple(versions) for name, versions in cache["updates"].items()}
+            cache.setdefault("digest", None)
+            return cache
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug("Ignoring unreadable winget cache: %s", e)
+            return None
+
+    def _save_update_cache(self, installed: dict, updates: dict, digest: Optional[str]) -> None:
+        """Store a winget scan with its timestamp and the digest of the output it was parsed from."""
+        try:
+            data = _dump_json({"ts": time.time(), "digest": digest, "installed": installed, "updates": updates})
+            self._UPDATE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._UPDATE_CACHE_PATH.with_suffix(".json.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, self._UPDATE_CACHE_PATH)
+        except Exception as e:
+            logger.error("Error saving winget cache: %s", e)
+
+    def _query_winget_json(self, startupinfo, known: Optional[dict] = None) -> Optional[tuple[dict, dict, str]]:
+        """List installed packages and updates through Get-WinGetPackage.
+        
+        Returns the packages and the digest of the output, or None when the
+        Microsoft.WinGet.Client module is not available.
+        """
+        # Le module manquant ne réapparaît pas pendant la session, inutile de relancer PowerShell
+        if UpdatesManager._winget_module_available is False:
+            return None
+        
+        process = subprocess.run(
+            [
+                "powershell", "-NoProfile", "-NonInteractive", "-Command",
+                "[Console]::OutputEncoding = [Text.Encoding]::UTF8; "
+                "Get-WinGetPackage | Select-Object Name,Id,InstalledVersion,AvailableVersions,IsUpdateAvailable"
+                " | ConvertTo-Json -Compress"
+            ],
+            capture_output=True,
+            startupinfo=startupinfo
         )
-        checkbox.grid(row=0, column=0, sticky="w", padx=5)
+        if process.returncode != 0 or not process.stdout.strip():
+            # Seule l'absence de la cmdlet est définitive, les autres échecs ne valent que pour ce scan
+            error = process.stderr.decode('utf-8', errors='replace')
+            if "CommandNotFoundException" in error or "is not recognized" in error:
+                logger.debug("Get-WinGetPackage not found, using winget text output for this session")
+                UpdatesManager._winget_module_available = False
+            else:
+                logger.debug("Get-WinGetPackage failed, falling back to winget text output")
+            return None
+        UpdatesManager._winget_module_available = True
         
-        # Stocker la référence à la checkbox dans le frame
-        package_frame.checkbox = checkbox_var
-        package_frame.package_name = name
+        digest = "json:" + hashlib.blake2b(process.stdout, digest_size=16).hexdigest()
+        reused = self._reuse_known_packages(digest, known)
+        if reused is not None:
+            return reused
         
-        # Nom du paquet (colonne 1)
-        name_label = ctk.CTkLabel(
-            package_frame,
-            text=name,
-            text_color=self.colors.text.primary,
-            anchor="w",
-            width=200  # Largeur fixe pour le nom
+        try:
+            packages = _load_json(process.stdout)
+        except ValueError as e:
+            logger.debug("Could not parse Get-WinGetPackage output: %s", e)
+            return None
+        # ConvertTo-Json emits a bare object when there is a single package
+        if isinstance(packages, dict):
+            packages = [packages]
+        
+        installed = {}
+        updates = {}
+        for package in packages:
+            name = package.get("Name")
+            version = package.get("InstalledVersion")
+            if not name or not version:
+                continue
+            installed[name] = version
+            available = package.get("AvailableVersions") or []
+            if package.get("IsUpdateAvailable") and available:
+                updates[name] = (version, available[0])
+        
+        self._add_log(f"Found {len(installed)} installed packages\n")
+        return installed, updates, digest
+
+    def _reuse_known_packages(self, digest: str, known: Optional[dict]) -> Optional[tuple[dict, dict, str]]:
+        """Return the cached packages if they were parsed from the same winget output."""
+        if known is None or known["digest"] != digest:
+            return None
+        self._add_log(f"winget output unchanged, {len(known['installed'])} installed packages\n")
+        return known["installed"], known["updates"], digest
+
+    async def _run_winget(self, args: list[str], startupinfo, check: bool = True) -> list[str]:
+        """Run a winget command on the event loop and return its output lines.
+        
+        Lines are decoded as winget writes them, instead of buffering and splitting
+        the whole output once the process exits.
+        """
+        process = await asyncio.create_subprocess_exec(
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            startupinfo=startupinfo
         )
-        name_label.grid(row=0, column=1, sticky="w", padx=5)
-        
-        # Version actuelle (colonne 2)
-        current_label = ctk.CTkLabel(
-            package_frame,
-            text=current_version,
-            text_color=self.colors.text.primary,
-            anchor="e",
-            width=100  # Largeur fixe pour la version
+        lines = [
+            line.decode('utf-8', errors='replace').rstrip("\r\n")
+            async for line in process.stdout
+        ]
+        await process.wait()
+        if check and process.returncode != 0:
+            raise ValueError(f"{' '.join(args[:2])} failed with exit code {process.returncode}")
+        return lines
+
+    async def _run_winget_list_and_upgrade(self, startupinfo) -> tuple[list[str], list[str]]:
+        """Run winget list and winget upgrade concurrently."""
+        return await asyncio.gather(
+            self._run_winget(
+                ["winget", "list", "--accept-source-agreements", "--disable-interactivity"],
+                startupinfo
+            ),
+            self._run_winget(
+                ["winget", "upgrade", "--include-unknown", "--disable-interactivity", "--accept-source-agreements"],
+                startupinfo
+            )
         )
-        current_label.grid(row=0, column=2, sticky="e", padx=5)
+
+    def _read_winget_list(self, output: list[str]) -> tuple[Optional[dict], list[str]]:
+        """Parse the installed packages table of a winget list command.
+        
+        Returns the packages (None if no header was found) and the lines before the header.
+        """
+        lines = iter(output)
+        preamble = []
+        # Chercher la ligne d'en-tête (plusieurs formats possibles)
+        for header in lines:
+            match = _WINGET_LIST_HEADER_RE.search(header)
+            if match:
+                break
+            preamble.append(header)
+        else:
+            return None, preamble
         
-        # Nouvelle version (colonne 3)
-        if new_version:
-            version_frame = ctk.CTkFrame(package_frame, fg_color="transparent")
-            version_frame.grid(row=0, column=3, sticky="e", padx=5)
-            
-            # Flèche
-            arrow_label = ctk.CTkLabel(
-                version_frame,
-                text="→",
-                text_color=self.colors.status.success,  # Vert
-                anchor="e"
-            )
-            arrow_label.pack(side="left", padx=2)
-            
-            # Nouvelle version
-            update_label = ctk.CTkLabel(
-                version_frame,
-                text=new_version,
-                text_color=self.colors.status.success,  # Vert
-                anchor="e",
-                width=100  # Largeur fixe pour la version
-            )
-            update_label.pack(side="left", padx=2)
-            
-            # Activer la checkbox seulement si une mise à jour est disponible
-            checkbox.configure(state="normal")
+        # Positions des colonnes, quelle que soit la langue, données par le match de l'en-tête
+        name_pos, id_pos, version_pos = match.start(1), match.start(2), match.start(3)
+        next(lines, None)  # Skip separator
+        
+        # Parser les paquets installés (bornes vérifiées avant le découpage, sans try par ligne)
+        installed = {}
+        np, ip, vp = name_pos, id_pos, version_pos
+        for line in lines:
+            if len(line) <= vp or line.startswith("-"):
+                continue
+            version = line[vp:].split(None, 1)
+            name = line[np:ip].strip()
+            if name and version:
+                installed[name] = version[0]
+        return installed, preamble
+
+    def _parse_winget_text(self, startupinfo, known: Optional[dict] = None) -> Optional[tuple[dict, dict, Optional[str]]]:
+        """List installed packages and updates by parsing the winget CLI tables.
+        
+        Returns the packages and the digest of the output, or None if the tables were not found.
+        """
+        self._add_log("Scanning installed packages and updates...\n")
+        
+        # Les deux commandes sont indépendantes, on les lance en parallèle sur la boucle asyncio
+        list_output, upgrade_output = self.parent._run_async(
+            self._run_winget_list_and_upgrade(startupinfo)
+        ).result()
+        
+        digest = hashlib.blake2b(digest_size=16)
+        for line in list_output + ["\0"] + upgrade_output:
+            digest.update(line.encode("utf-8", errors="replace"))
+            digest.update(b"\n")
+        digest = "text:" + digest.hexdigest()
+        reused = self._reuse_known_packages(digest, known)
+        if reused is not None:
+            return reused
+        
+        installed, preamble = self._read_winget_list(list_output)
+        if installed is None:
+            # La sortie de secours n'est pas couverte par l'empreinte
+            digest = None
+            # Essayer une autre commande
+            list_output = self.parent._run_async(self._run_winget(
+                ["winget", "list", "--source", "winget", "--accept-source-agreements"],
+                startupinfo,
+                check=False
+            )).result()
+            installed, preamble = self._read_winget_list(list_output)
+        
+        if installed is None:
+            self._add_log("Warning: Could not parse winget list output format\n")
+            self._add_log("Raw output:\n" + "\n".join(preamble) + "\n")
+            return None
+        
+        self._add_log(f"Found {len(installed)} installed packages\n")
+        
+        # Vérifier les mises à jour disponibles
+        updates = {}
+        lines = iter(upgrade_output)
+        
+        # Chercher la ligne d'en-tête
+        for header in lines:
+            match = _WINGET_UPGRADE_HEADER_RE.search(header)
+            if match:
+                break
         else:
-            checkbox.configure(state="disabled")
+            match = None
+        
+        if match is not None:
+            # Colonnes d'un seul mot après « Available » (Source)
+            trailing = len(header[match.end(3):].split())
+            next(lines, None)  # Skip separator
+            
+            # Parser les mises à jour disponibles en un seul passage de regex sur le tableau,
+            # qui s'arrête à la première ligne vide (la suite n'est que du texte récapitulatif)
+            table = "\n".join(takewhile(str.strip, lines))
+            for row in _winget_upgrade_row_re(trailing).finditer(table):
+                name, current, new = row.groups()
+                if current != new:
+                    updates[name] = (current, new)
+        
+        return installed, updates, digest
 
     def _add_log(self, message: str) -> None:
-        """Add message to log window."""
+        """Queue a message for the log window, from any thread.
+        
+        Messages are written by _flush_log at most every 50 ms, so a burst of
+        winget output costs a single insert.
+        """
+        self._log_queue.append(message)
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            # Le timer Tk est armé depuis le thread Tk, via la file de la fenêtre principale
+            self.parent._post_to_tk(self._schedule_log_flush)
+
+    def _schedule_log_flush(self, _=None) -> None:
+        """Arm the 50 ms log flush timer (runs on the Tk thread)."""
+        if self.winfo_exists():
+            self.after(50, self._flush_log)
+
+    def _flush_log(self) -> None:
+        """Write the queued messages to the log window (runs on the Tk thread)."""
+        self._log_flush_scheduled = False
+        pending = self._log_queue
+        messages = []
+        while pending:
+            messages.append(pending.popleft())
+        if not messages:
+            return
         try:
-            if hasattr(self, 'log_text'):
-                self.log_text.configure(state="normal")
-                self.log_text.insert("end", message)
-                self.log_text.configure(state="disabled")
-                self.log_text.see("end")
-                self.update_idletasks()
+            self.log_text.configure(state="normal")
+            self.log_text.insert("end", "".join(messages))
+            self.log_text.configure(state="disabled")
+            self.log_text.see("end")
         except Exception as e:
             logger.error(f"Error adding log message: {e}")
 
     def _update_selected(self) -> None:
         """Mettre à jour les paquets sélectionnés."""
-        # Lancer la mise à jour en arrière-plan
-        threading.Thread(
-            target=self._update_selected_thread,
-            daemon=True
-        ).start()
-
-    def _update_selected_thread(self) -> None:
-        """Thread pour mettre à jour les paquets sélectionnés."""
-        try:
-            # Configure process to hide window
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            startupinfo.wShowWindow = subprocess.SW_HIDE
-            
-            # Récupérer les paquets sélectionnés
-            selected_packages = []
-            for widget in self.packages_list.winfo_children():
-                if hasattr(widget, 'checkbox') and widget.checkbox.get():
-                    selected_packages.append(widget.package_name)
-            
-            if not selected_packages:
-                self._add_log("\nNo packages selected for update.\n")
-                return
-            
-            self._add_log(f"\nUpdating {len(selected_packages)} selected packages...\n")
-            
-            # Mettre à jour chaque paquet sélectionné
-            for package in selected_packages:
-                self._add_log(f"\nUpdating {package}...\n")
-                process = subprocess.run(
-                    ["winget", "upgrade", package],
-                    capture_output=True,
-                    text=True,
-                    startupinfo=startupinfo
-                )
-                self._add_log(process.stdout)
+        # Récupérer les paquets sélectionnés
+        selected_packages = [name for name, selected in self._checked.items() if selected]
+        if not selected_packages:
+            self._add_log("\nNo packages selected for update.\n")
+            return
+        
+        # Lancer la mise à jour sur la boucle asyncio, la liste est rafraîchie sur le thread Tk
+        self.parent._run_async(self._update_selected_async(selected_packages), self._on_update_finished)
+
+    async def _update_selected_async(self, selected_packages: list[str]) -> bool:
+        """Upgrade the selected packages one after the other, streaming winget output to the log.
+        
+        Returns True once the upgrades ran. Clicks made while an update is running,
+        from this window or a reopened one, wait for it instead of starting winget concurrently.
+        """
+        # Le verrou vit sur la fenêtre principale, une fenêtre rouverte attend la mise à jour en cours
+        if self.parent._update_lock is None:
+            self.parent._update_lock = asyncio.Lock()
+        async with self.parent._update_lock:
+            try:
+                startupinfo = self._hidden_startupinfo
                 
-            self._add_log("\nUpdate process completed.\n")
-            
-            # Rafraîchir la liste
-            self._check_updates()
-            
-        except Exception as e:
-            self._add_log(f"Error during update: {str(e)}\n")
-            logger.error(f"Error updating packages: {e}")
+                self._add_log(f"\nUpdating {len(selected_packages)} selected packages...\n")
+                
+                # Mettre à jour chaque paquet sélectionné (winget n'accepte qu'un paquet par upgrade),
+                # la sortie est affichée au fil de l'eau
+                for package in selected_packages:
+                    self._add_log(f"\nUpdating {package}...\n")
+                    process = await asyncio.create_subprocess_exec(
+                        "winget", "upgrade", package, "--accept-package-agreements", "--accept-source-agreements",
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.STDOUT,
+                        startupinfo=startupinfo
+                    )
+                    async for line in process.stdout:
+                        self._add_log(line.decode('utf-8', errors='replace'))
+                    await process.wait()
+                    
+                self._add_log("\nUpdate process completed.\n")
+                return True
+                
+            except Exception as e:
+                self._add_log(f"Error during update: {str(e)}\n")
+                logger.error(f"Error updating packages: {e}")
+                return False
+
+    def _on_update_finished(self, updated: Optional[bool]) -> None:
+        """Refresh the list after an update (runs on the Tk thread)."""
+        # Rafraîchir la liste, le cache ne reflète plus les versions installées
+        if updated and self.winfo_exists():
+            self._check_updates(use_cache=False, keep_rows=True)
 
     def _toggle_all_packages(self) -> None:
         """Sélectionner/désélectionner tous les paquets."""
         selected = self.select_all_var.get()
-        for widget in self.packages_list.winfo_children():
-            if hasattr(widget, 'checkbox'):
-                checkbox = widget.winfo_children()[0]  # La checkbox est le premier enfant
-                if checkbox.cget("state") == "normal":  # Ne changer que les checkboxes actives
-                    widget.checkbox.set(selected)
+        # Seuls les paquets avec une mise à jour sont sélectionnables
+        self._checked = dict.fromkeys(self._checked, selected)
+        # Les lignes affichées gardent leur paquet, seule la case change
+        self._syncing_rows = True
+        try:
+            for package_frame in self._row_pool:
+                if package_frame.shown and package_frame.package_name in self._checked:
+                    package_frame.checkbox.set(selected)
+        finally:
+            self._syncing_rows = False
 
 
 def main():
@@ -6,6 +6,11 @@ from pathlib import Path
 import json
 from dataclasses import dataclass
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup, fall back to stdlib json
+    orjson = None
+
 @dataclass
 class AttributeScheme:
     """Classe générique pour gérer les attributs du thème."""
@@ -193,8 +198,8 @@ class SystemConfig(BaseModel):
             if not theme_path.exists():
                 theme_path = Path("configs") / "default_theme.json"
             
-            with open(theme_path, encoding="utf-8") as f:
-                theme_data = json.load(f)
+            data = theme_path.read_bytes()
+            theme_data = orjson.loads(data) if orjson is not None else json.loads(data)
             
             return ThemeConfig.from_dict(theme_data)
         except Exception as e:
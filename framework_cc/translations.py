@@ -1,5 +1,7 @@
 """Translations module for Framework Control Center."""
 
+from functools import lru_cache
+
 # English translations (default)
 en = {
     # Main window
@@ -302,8 +304,12 @@ language_names = {
     "tlh": "tlhIngan Hol"
 }
 
+@lru_cache(maxsize=512)
 def get_text(lang_code: str, key: str, default: str = None) -> str:
-    """Get translated text for a given key."""
+    """Get translated text for a given key.
+    
+    Results are memoized since the translation tables never change at runtime.
+    """
     try:
         # Split nested keys (e.g., "power_profiles.silent")
         keys = key.split(".")